@@ -2,6 +2,7 @@
 Performance metrics calculation for backtesting.
 """
 
+from statistics import fmean
 from typing import Dict, List, Any
 import pandas as pd
 import numpy as np
@@ -39,17 +40,17 @@ class PerformanceMetrics:
                 winning_pnls = [pnl for pnl in trade_pnls if pnl > 0]
                 losing_pnls = [pnl for pnl in trade_pnls if pnl < 0]
                 
-                metrics['avg_trade_pnl'] = np.mean(trade_pnls)
+                metrics['avg_trade_pnl'] = fmean(trade_pnls)
                 
                 if winning_pnls:
-                    metrics['avg_winning_trade'] = np.mean(winning_pnls)
+                    metrics['avg_winning_trade'] = fmean(winning_pnls)
                     metrics['largest_win'] = max(winning_pnls)
                 else:
                     metrics['avg_winning_trade'] = 0
                     metrics['largest_win'] = 0
                 
                 if losing_pnls:
-                    metrics['avg_losing_trade'] = np.mean(losing_pnls)
+                    metrics['avg_losing_trade'] = fmean(losing_pnls)
                     metrics['largest_loss'] = min(losing_pnls)
                 else:
                     metrics['avg_losing_trade'] = 0
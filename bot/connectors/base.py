@@ -7,7 +7,7 @@ retry logic, and health checking.
 
 import time
 import logging
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, List
 from datetime import datetime
 
 from bot.core.circuit_breaker import get_circuit_breaker_registry
@@ -352,6 +352,44 @@ class BaseDataConnector:
         """
         raise NotImplementedError("Subclasses must implement fetch_bars")
     
+    def fetch_bars_batch(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch historical bars for several symbols.
+        
+        Connectors whose API has a multi-symbol endpoint should override this
+        to answer in one request; the default calls fetch_bars per symbol.
+        
+        Args:
+            symbols: Trading symbols
+            timeframe: Timeframe (e.g., '1h', '1d')
+            limit: Number of bars to fetch per symbol
+            
+        Returns:
+            Symbol -> DataFrame for each symbol that returned data
+        """
+        result = {}
+        for symbol in symbols:
+            try:
+                bars = self.fetch_bars(symbol, timeframe, limit)
+            except Exception as e:
+                self.logger.warning(f"{self.CONNECTOR_NAME} bars failed for {symbol}: {e}")
+                continue
+            if bars is not None and not getattr(bars, 'empty', False):
+                result[symbol] = bars
+        return result
+    
+    def has_bars_batch(self) -> bool:
+        """
+        Whether fetch_bars_batch is a real multi-symbol request (overridden),
+        rather than the serial per-symbol default above.
+        """
+        return type(self).fetch_bars_batch is not BaseDataConnector.fetch_bars_batch
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get connector status.
@@ -10,6 +10,7 @@ import pandas as pd
 import logging
 from datetime import datetime
 import time
+import hashlib
 
 from bot.connectors.base import BaseDataConnector
 from bot.connectors.coingecko import CoinGeckoConnector
@@ -112,6 +113,9 @@ class MultiSourceConnector(BaseDataConnector):
         self.last_live_data_time = None
         self.data_source_failures = 0
         
+        # (monotonic time, status dict) - see get_cached_status()
+        self._status_cache: Optional[tuple] = None
+        
         # Minimum sources required (depends on mode)
         self.min_sources_required = 1 if self.mode == 'VERIFIED_TEST' else 2
         
@@ -389,7 +393,6 @@ class MultiSourceConnector(BaseDataConnector):
         secondary_source: str
     ) -> str:
         """Generate SHA-256 checksum for price verification."""
-        import hashlib
         data = f"{symbol}|{price:.8f}|{primary_ts}|{primary_source}|{secondary_ts}|{secondary_source}"
         checksum = hashlib.sha256(data.encode()).hexdigest()
         return checksum
@@ -452,6 +455,49 @@ class MultiSourceConnector(BaseDataConnector):
         
         return pd.DataFrame()
     
+    def has_bars_batch(self) -> bool:
+        """Whether any source answers fetch_bars_batch with a multi-symbol request."""
+        return any(connector.has_bars_batch() for connector in self.all_connectors)
+    
+    def fetch_bars_batch(
+        self,
+        symbols: List[str],
+        timeframe: str,
+        limit: Optional[int] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch bars for several symbols, asking each source once for every symbol
+        it is currently next in line for. Symbols a source leaves unanswered move
+        on to their next fallback; symbols no source answers are omitted.
+        """
+        pending = {symbol: self._get_connectors_for_symbol(symbol) for symbol in symbols}
+        result: Dict[str, pd.DataFrame] = {}
+        depth = 0
+        while pending:
+            groups: Dict[int, Any] = {}
+            for symbol, connectors in pending.items():
+                if depth < len(connectors):
+                    connector = connectors[depth]
+                    groups.setdefault(id(connector), (connector, []))[1].append(symbol)
+            if not groups:
+                break
+            for connector, group in groups.values():
+                try:
+                    bars_map = connector.fetch_bars_batch(group, timeframe, limit)
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Error fetching bars from {connector.CONNECTOR_NAME}: {e}")
+                    continue
+                for symbol in group:
+                    bars = bars_map.get(symbol)
+                    if bars is not None and not bars.empty:
+                        result[symbol] = bars
+                        del pending[symbol]
+            depth += 1
+        
+        if pending:
+            self.logger.error(f"❌ NO BAR DATA from any source for {', '.join(pending)}")
+        return result
+    
     def get_price_checksum(self, symbol: str, price: float) -> str:
         """Generate checksum for a price (legacy method for compatibility)."""
         timestamp = datetime.utcnow().isoformat()
@@ -468,6 +514,14 @@ class MultiSourceConnector(BaseDataConnector):
         """Get price audit trail."""
         return self.price_audit_trail[-limit:]
     
+    def get_cached_status(self, ttl: float = 30.0) -> Dict[str, Any]:
+        """get_status(), rebuilt at most once every `ttl` seconds."""
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is None or now - cached[0] >= ttl:
+            cached = self._status_cache = (now, self.get_status())
+        return cached[1]
+    
     def get_status(self) -> Dict[str, Any]:
         """Get status of all connectors."""
         primary_names = [
@@ -65,16 +65,24 @@ class Strategy(ABC):
     
     Strategies must implement generate_signal and set_parameters methods.
     Strategies can use any combination of indicators.
+    
+    Declares __slots__ so subclasses may too; subclasses that don't keep an
+    instance __dict__ as usual.
     """
     
-    def __init__(self, name: str, parameters: Optional[Dict[str, Any]] = None):
+    __slots__ = ('name', 'parameters', 'indicators', 'logger')
+    
+    def __init__(self, name: Optional[str] = None, parameters: Optional[Dict[str, Any]] = None):
         """
         Initialize the strategy.
         
         Args:
-            name: Unique identifier for the strategy
+            name: Unique identifier for the strategy (default: the class's
+                STRATEGY_NAME, or its class name)
             parameters: Configuration parameters for the strategy
         """
+        if name is None:
+            name = getattr(self, 'STRATEGY_NAME', type(self).__name__)
         self.name = name
         self.parameters = parameters or {}
         self.indicators: Dict[str, Indicator] = {}
@@ -116,6 +124,29 @@ class Strategy(ABC):
         """
         self.indicators[indicator.get_name()] = indicator
     
+    def create_signal(self, signal: str, score: float, reason: str,
+                      metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Create a signal dict in the generate_signal format from a 0-100 score.
+        
+        Args:
+            signal: 'BUY', 'SELL' or 'HOLD'
+            score: Signal strength from 0 to 100 (confidence is score / 100,
+                clamped to [0, 1])
+            reason: Explanation for the signal
+            metadata: Additional strategy-specific data
+        """
+        confidence = score / 100.0
+        if not 0.0 <= confidence <= 1.0:
+            confidence = 0.0 if confidence < 0.0 else 1.0
+        return {
+            'strategy_name': self.name,
+            'signal': signal,
+            'confidence': confidence,
+            'reason': reason,
+            'metadata': metadata if metadata is not None else {}
+        }
+    
     def get_name(self) -> str:
         """Return the name of the strategy."""
         return self.name
@@ -176,10 +176,12 @@ class PriceManager:
             asset_class = normalized['class']
             max_deviation = self.DEVIATION_THRESHOLDS.get(asset_class, 0.015)
             
-            # Get connector status for source info
-            status = self.connector.get_status()
-            active_source = status.get('active_data_source', 'unknown')
-            sources_status = status.get('sources', {})
+            # Active source is read live; the per-source status snapshot may be up to 30s old
+            active_source = getattr(self.connector, 'active_data_source', 'unknown')
+            if hasattr(self.connector, 'get_cached_status'):
+                sources_status = self.connector.get_cached_status().get('sources', {})
+            else:
+                sources_status = self.connector.get_status().get('sources', {})
             
             # Get audit trail for secondary source info
             audit_trail = self.connector.get_audit_trail(limit=5)
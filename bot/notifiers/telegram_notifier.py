@@ -12,13 +12,17 @@ Compatible with both sync and async callers.
 """
 
 import os
+import functools
 import asyncio
 import logging
 import sqlite3
+import threading
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, time
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
+from time import monotonic, gmtime, strftime, time as _wall_time
 
 try:
     from telegram import Bot, InlineKeyboardMarkup, InlineKeyboardButton, Update
@@ -29,9 +33,57 @@ except Exception:
     TELEGRAM_AVAILABLE = False
     Bot = None
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except Exception:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from bot.utils.serialization import dumps as _dumps
+
 logger = logging.getLogger("APEX_TELEGRAM")
 logger.setLevel(logging.INFO)
 
+def json_fragment(text: str) -> bytes:
+    """JSON-escaped UTF-8 bytes of text without the surrounding quotes, for splicing into a body."""
+    return _dumps(text)[1:-1]
+
+
+# static message parts (banners, footers) are encoded once and reused
+_static_fragment = functools.lru_cache(maxsize=32)(json_fragment)
+
+TELEGRAM_API_URL = "https://api.telegram.org/bot{token}/sendMessage"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# client-side limit: at most RATE_LIMIT_MSGS messages per RATE_LIMIT_WINDOW seconds
+RATE_LIMIT_MSGS = 20
+RATE_LIMIT_WINDOW = 60.0
+
+_ts_cache: Tuple[int, str] = (0, "")
+
+
+def utc_ts() -> str:
+    """UTC 'YYYY-mm-dd HH:MM:SS' string, formatted at most once per second."""
+    global _ts_cache
+    sec = int(_wall_time())
+    if _ts_cache[0] != sec:
+        _ts_cache = (sec, strftime("%Y-%m-%d %H:%M:%S", gmtime(sec)))
+    return _ts_cache[1]
+
+
+# Telegram rejects messages over 4096 chars; leave room for the "(part k/n)" suffix
+MAX_MESSAGE_CHARS = 4000
+
+
+def split_message(text: str, limit: int = MAX_MESSAGE_CHARS) -> List[str]:
+    """Split text into Telegram-sized chunks, suffixing each with (part k/n) when split."""
+    if len(text) <= limit:
+        return [text]
+    chunks = [text[i:i + limit] for i in range(0, len(text), limit)]
+    n = len(chunks)
+    return [f"{c}\n(part {k}/{n})" for k, c in enumerate(chunks, 1)]
+
 
 # --------------------
 # Simple SQLite trade DB
@@ -41,6 +93,9 @@ class TradeDB:
         db_dir = Path(db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # inserts run in worker threads (see TelegramNotifier._record_and_send);
+        # every use of the shared connection holds this lock
+        self._lock = threading.Lock()
         self._init_tables()
 
     def _init_tables(self):
@@ -67,37 +122,41 @@ class TradeDB:
         self.conn.commit()
 
     def insert_trade(self, rec: Tuple):
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO trades(symbol, side, entry, stop, tp1, tp2, tp3, confidence, tier, status, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            rec,
-        )
-        self.conn.commit()
-        return cur.lastrowid
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute(
+                """
+                INSERT INTO trades(symbol, side, entry, stop, tp1, tp2, tp3, confidence, tier, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rec,
+            )
+            self.conn.commit()
+            return cur.lastrowid
 
     def close_trade(self, trade_id: int, pnl: float):
-        cur = self.conn.cursor()
-        cur.execute("UPDATE trades SET status = 'closed', pnl = ? WHERE id = ?", (pnl, trade_id))
-        self.conn.commit()
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("UPDATE trades SET status = 'closed', pnl = ? WHERE id = ?", (pnl, trade_id))
+            self.conn.commit()
 
     def get_stats(self) -> Dict[str, Any]:
-        cur = self.conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM trades")
-        total = cur.fetchone()[0] or 0
-        cur.execute("SELECT COUNT(*) FROM trades WHERE status='closed'")
-        closed = cur.fetchone()[0] or 0
-        cur.execute("SELECT SUM(pnl) FROM trades WHERE status='closed'")
-        s = cur.fetchone()[0]
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("SELECT COUNT(*) FROM trades")
+            total = cur.fetchone()[0] or 0
+            cur.execute("SELECT COUNT(*) FROM trades WHERE status='closed'")
+            closed = cur.fetchone()[0] or 0
+            cur.execute("SELECT SUM(pnl) FROM trades WHERE status='closed'")
+            s = cur.fetchone()[0]
         total_pnl = float(s) if s is not None else 0.0
         return {"total_trades": total, "closed_trades": closed, "total_pnl": total_pnl}
 
     def get_open_trades(self):
-        cur = self.conn.cursor()
-        cur.execute("SELECT id, symbol, side, entry, stop, tp1, tp2, tp3, confidence, tier, created_at FROM trades WHERE status='open'")
-        rows = cur.fetchall()
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute("SELECT id, symbol, side, entry, stop, tp1, tp2, tp3, confidence, tier, created_at FROM trades WHERE status='open'")
+            rows = cur.fetchall()
         keys = ["id","symbol","side","entry","stop","tp1","tp2","tp3","confidence","tier","created_at"]
         return [dict(zip(keys, r)) for r in rows]
 
@@ -123,6 +182,21 @@ class Signal:
 # Notifier
 # --------------------
 class TelegramNotifier:
+    # filled with pre-formatted strings by _format_signal_text
+    _SIGNAL_TEMPLATE = (
+        "🛡️ APEX SIGNAL™ • v{version}\n\n"
+        "🔔 {symbol} — {side}\n"
+        "📈 Strategy: {strategy}\n"
+        "💎 Confidence: {confidence} ({tier})\n"
+        "📌 Entry: ${entry}\n"
+        "🛑 SL: ${sl}\n"
+        "🎯 TP1: ${tp1} | TP2: ${tp2} | TP3: ${tp3}\n"
+        "⚖️ Estimated RR (TP2): {rr}\n"
+        "🧾 Indicators: {indicators}\n"
+        "⏱ UTC: {ts}\n\n"
+        "— APEX SIGNAL™ (institutional)"
+    )
+
     def __init__(self, token: Optional[str] = None, chat_id: Optional[str] = None, enabled_override: Optional[bool] = None):
         # token/chat can be passed in or read from env
         self.token = token or os.getenv("TELEGRAM_BOT_TOKEN")
@@ -130,6 +204,15 @@ class TelegramNotifier:
         self.enabled = enabled_override if enabled_override is not None else bool(self.token and self.chat_id and TELEGRAM_AVAILABLE)
         self.version = "4.0.0"
         self.db = TradeDB(db_path=os.getenv("APEX_TRADE_DB", "apex_trades.db"))
+        # in-flight send tasks (awaited by drain() on shutdown)
+        self._pending: set = set()
+        # aiohttp session for direct Bot API posts, created lazily on the running loop
+        self._http = None
+        self._send_url = TELEGRAM_API_URL.format(token=self.token) if self.token else None
+        self._body_prefix = b'{"chat_id":' + _dumps(self.chat_id) + b',"text":"'
+        # one send at a time, plus send timestamps for the sliding rate-limit window
+        self._tg_sem = asyncio.Semaphore(1)
+        self._tg_sent: deque = deque(maxlen=RATE_LIMIT_MSGS)
 
         # quiet hours default (UTC)
         self.quiet_start = time(23, 0)
@@ -148,10 +231,58 @@ class TelegramNotifier:
                 logger.warning("python-telegram-bot not available; Telegram disabled")
             else:
                 logger.warning("Telegram disabled: missing token/chat id")
+        # resolve the send path once; enabled does not change after construction
+        self._deliver = self._send_live if self.enabled else self._send_test
 
     def is_enabled(self) -> bool:
         return self.enabled
 
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """Wait for in-flight sends; anything still pending after `timeout` is cancelled."""
+        if not self._pending:
+            return
+        try:
+            await asyncio.wait_for(asyncio.gather(*self._pending, return_exceptions=True), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Telegram drain timed out; %d send(s) cancelled", len(self._pending))
+
+    async def close(self) -> None:
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+
+    async def _throttle(self) -> None:
+        """Sleep until another message fits in the window. Call with _tg_sem held."""
+        now = monotonic()
+        sent = self._tg_sent
+        while sent and now - sent[0] > RATE_LIMIT_WINDOW:
+            sent.popleft()
+        if len(sent) >= RATE_LIMIT_MSGS:
+            wait = RATE_LIMIT_WINDOW - (now - sent[0])
+            logger.info("Telegram rate limit reached; delaying send by %.1fs", wait)
+            await asyncio.sleep(wait)
+        sent.append(monotonic())
+
+    async def _post_message(self, text: str, reply_markup: Optional[Dict[str, Any]] = None) -> None:
+        payload: Dict[str, Any] = {"chat_id": self.chat_id, "text": text}
+        if reply_markup is not None:
+            payload["reply_markup"] = reply_markup
+        await self._post_body(_dumps(payload))
+
+    async def _post_body(self, body: bytes) -> None:
+        """POST sendMessage straight to the Bot API with a pre-serialized JSON body."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        async with self._http.post(self._send_url, data=body, headers=_JSON_HEADERS) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"Telegram API HTTP {resp.status}: {(await resp.text())[:200]}")
+
     # Confidence tiers
     def _tier(self, confidence: float) -> str:
         if confidence >= 85:
@@ -168,23 +299,23 @@ class TelegramNotifier:
             # overnight window
             return now >= self.quiet_start or now <= self.quiet_end
 
-    def _format_signal_text(self, s: Signal) -> str:
-        tier = self._tier(s.confidence)
-        indicators = ", ".join(s.indicators[:8]) if s.indicators else "N/A"
-        rr = self._calc_rr(s)
-        return (
-            f"🛡️ APEX SIGNAL™ • v{self.version}\n\n"
-            f"🔔 {s.symbol} — {s.side}\n"
-            f"📈 Strategy: {s.strategy_name}\n"
-            f"💎 Confidence: {s.confidence:.1f}% ({tier})\n"
-            f"📌 Entry: ${s.entry:,.6f}\n"
-            f"🛑 SL: ${s.sl:,.6f}\n"
-            f"🎯 TP1: ${s.tp1:,.6f} | TP2: ${s.tp2:,.6f} | TP3: ${s.tp3:,.6f}\n"
-            f"⚖️ Estimated RR (TP2): {rr:.2f}\n"
-            f"🧾 Indicators: {indicators}\n"
-            f"⏱ UTC: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            f"— APEX SIGNAL™ (institutional)"
-        )
+    def _format_signal_text(self, s: Signal, tier: Optional[str] = None) -> str:
+        return self._SIGNAL_TEMPLATE.format_map({
+            'version': self.version,
+            'symbol': s.symbol,
+            'side': s.side,
+            'strategy': s.strategy_name,
+            'confidence': format(s.confidence, ".1f") + "%",
+            'tier': tier or self._tier(s.confidence),
+            'entry': format(s.entry, ",.6f"),
+            'sl': format(s.sl, ",.6f"),
+            'tp1': format(s.tp1, ",.6f"),
+            'tp2': format(s.tp2, ",.6f"),
+            'tp3': format(s.tp3, ",.6f"),
+            'rr': format(self._calc_rr(s), ".2f"),
+            'indicators': ", ".join(s.indicators[:8]) if s.indicators else "N/A",
+            'ts': utc_ts(),
+        })
 
     def _calc_rr(self, s: Signal) -> float:
         try:
@@ -196,28 +327,44 @@ class TelegramNotifier:
             return 0.0
 
     async def _send(self, text: str, signal: Optional[Signal] = None) -> bool:
-        if not self.enabled:
-            logger.info("[TELEGRAM TEST MODE] %s", text.replace("\n", " | ")[:240])
-            return True
+        return await self._deliver(text, signal)
+
+    async def _send_test(self, text: str, signal: Optional[Signal] = None) -> bool:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[TELEGRAM TEST MODE] %.240s", text.replace("\n", " | "))
+        return True
+
+    async def _send_live(self, text: str, signal: Optional[Signal] = None) -> bool:
         if self._in_quiet_hours():
             logger.info("Quiet hours active — compacting notification")
             # send compact message
             text = text if len(text) < 400 else text[:400] + "..."
         # Build inline buttons if signal
         reply_markup = None
-        if signal and self.enabled:
+        if signal:
             buttons = [
-                [
-                    InlineKeyboardButton("📈 Copy Trade", callback_data=f"copy::{signal.symbol}::{signal.entry}"),
-                    InlineKeyboardButton("📊 Stats", callback_data="apex_stats"),
-                ]
+                ("📈 Copy Trade", f"copy::{signal.symbol}::{signal.entry}"),
+                ("📊 Stats", "apex_stats"),
             ]
-            reply_markup = InlineKeyboardMarkup(buttons)
+            if AIOHTTP_AVAILABLE:
+                reply_markup = {"inline_keyboard": [[{"text": t, "callback_data": d} for t, d in buttons]]}
+            else:
+                reply_markup = InlineKeyboardMarkup([[InlineKeyboardButton(t, callback_data=d) for t, d in buttons]])
+        chunks = split_message(text)
+        last = len(chunks) - 1
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self.bot.send_message(chat_id=self.chat_id, text=text, reply_markup=reply_markup)
-            )
+            for i, chunk in enumerate(chunks):
+                # buttons go on the final part only
+                markup = reply_markup if i == last else None
+                async with self._tg_sem:
+                    await self._throttle()
+                    if AIOHTTP_AVAILABLE:
+                        await self._post_message(chunk, markup)
+                        continue
+                    await asyncio.get_event_loop().run_in_executor(
+                        None,
+                        lambda chunk=chunk, markup=markup: self.bot.send_message(chat_id=self.chat_id, text=chunk, reply_markup=markup)
+                    )
             logger.info("✅ Telegram notification sent")
             return True
         except TelegramError as e:
@@ -227,48 +374,79 @@ class TelegramNotifier:
             logger.exception("Unexpected error sending Telegram message: %s", e)
             return False
 
-    def send_notification(self, message: str, raw_signal: Dict[str, Any]) -> bool:
+    async def send_framed(self, header: str, body: str, footer: str) -> bool:
+        """
+        Send header + body + footer as one message. On the direct HTTP path only
+        body is encoded per call; header and footer bytes are cached.
+        """
+        if (not self.enabled or not AIOHTTP_AVAILABLE
+                or len(header) + len(body) + len(footer) > MAX_MESSAGE_CHARS or self._in_quiet_hours()):
+            return await self._send(header + body + footer)
+        data = self._body_prefix + _static_fragment(header) + json_fragment(body) + _static_fragment(footer) + b'"}'
+        try:
+            async with self._tg_sem:
+                await self._throttle()
+                await self._post_body(data)
+            logger.info("✅ Telegram notification sent")
+            return True
+        except Exception as e:
+            logger.exception("Unexpected error sending Telegram message: %s", e)
+            return False
+
+    def send_notification(self, message: Optional[str], raw_signal: Dict[str, Any]) -> bool:
         """
         Backwards-compatible API used by engine.
         Accepts free-form message + raw signal dict (from engine).
-        Converts to internal Signal and dispatches.
+        Converts to internal Signal and dispatches. If message is None and the
+        signal cannot be parsed, str(raw_signal) is sent instead.
         """
         try:
             # Build Signal object when possible
             sig = None
             try:
+                # fallbacks are resolved only when the primary key is missing
+                tps = raw_signal.get("tps") or (0.0, 0.0, 0.0)
+                indicators = raw_signal.get("indicators")
+                if indicators is None:
+                    indicators = raw_signal.get("metadata", {}).get("indicators", [])
                 sig = Signal(
                     symbol=raw_signal.get("symbol", raw_signal.get("pair", "UNKNOWN")),
                     side=raw_signal.get("signal", raw_signal.get("side", "N/A")),
                     entry=float(raw_signal.get("price", raw_signal.get("entry", 0.0) or 0.0)),
                     sl=float(raw_signal.get("sl", raw_signal.get("stop_loss", 0.0) or 0.0)),
-                    tp1=float(raw_signal.get("tp1", raw_signal.get("tps", [0.0])[0] if raw_signal.get("tps") else 0.0)),
-                    tp2=float(raw_signal.get("tp2", raw_signal.get("tps", [0.0,0.0])[1] if raw_signal.get("tps") else 0.0)),
-                    tp3=float(raw_signal.get("tp3", raw_signal.get("tps", [0.0,0.0,0.0])[2] if raw_signal.get("tps") else 0.0)),
+                    tp1=float(raw_signal["tp1"] if "tp1" in raw_signal else tps[0]),
+                    tp2=float(raw_signal["tp2"] if "tp2" in raw_signal else tps[1]),
+                    tp3=float(raw_signal["tp3"] if "tp3" in raw_signal else tps[2]),
                     confidence=float(raw_signal.get("confidence", 0.0)),
                     strategy_name=raw_signal.get("strategy_name", raw_signal.get("strategy", "multi")),
-                    indicators=raw_signal.get("indicators", raw_signal.get("metadata", {}).get("indicators", []))
+                    indicators=indicators,
                 )
             except Exception:
                 logger.debug("Could not parse raw_signal into Signal; sending raw message")
                 sig = None
 
             if sig:
-                # persist trade in DB
                 tier = self._tier(sig.confidence)
                 rec = (sig.symbol, sig.side, sig.entry, sig.sl, sig.tp1, sig.tp2, sig.tp3, int(sig.confidence), tier, "open", datetime.utcnow().isoformat())
-                trade_id = self.db.insert_trade(rec)
-                # add trade id to message
-                text = self._format_signal_text(sig) + f"\n\nTradeID: {trade_id}"
-                asyncio.create_task(self._send(text, sig))
+                self._spawn(self._record_and_send(sig, tier, rec))
                 return True
             else:
-                asyncio.create_task(self._send(message, None))
+                self._spawn(self._send(message if message is not None else str(raw_signal), None))
                 return True
         except Exception:
             logger.exception("send_notification failed")
             return False
 
+    async def _record_and_send(self, sig: Signal, tier: str, rec: Tuple) -> bool:
+        """Persist the trade off the event loop, then send the message tagged with its trade id."""
+        text = self._format_signal_text(sig, tier)
+        try:
+            trade_id = await asyncio.to_thread(self.db.insert_trade, rec)
+        except Exception:
+            logger.exception("Failed to persist trade for %s", sig.symbol)
+            trade_id = "n/a"
+        return await self._send(text + f"\n\nTradeID: {trade_id}", sig)
+
     def send_heartbeat(self) -> bool:
         stats = self.db.get_stats()
         text = (
@@ -276,9 +454,9 @@ class TelegramNotifier:
             f"Total trades: {stats['total_trades']}\n"
             f"Closed trades: {stats['closed_trades']}\n"
             f"Total PnL: ${stats['total_pnl']:.2f}\n"
-            f"UTC: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}"
+            f"UTC: {utc_ts()}"
         )
-        asyncio.create_task(self._send(text, None))
+        self._spawn(self._send(text, None))
         return True
 
     def close_trade(self, trade_id: int, exit_price: float) -> bool:
@@ -297,7 +475,7 @@ class TelegramNotifier:
         self.db.close_trade(trade_id, round(pnl, 6))
         logger.info("Trade %s closed with PnL: %s", trade_id, pnl)
         # notify
-        asyncio.create_task(self._send(f"📌 Trade {trade_id} closed. PnL: {pnl:.6f}", None))
+        self._spawn(self._send(f"📌 Trade {trade_id} closed. PnL: {pnl:.6f}", None))
         return True
 
 
@@ -1,13 +1,13 @@
 """SQLite database implementation for Apex Signal Bot."""
 
 import sqlite3
-import json
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 
 from bot.persistence.models import Signal, ConnectorHealth, Telemetry, AuditLog
+from bot.utils.serialization import dumps_str
 
 logger = logging.getLogger(__name__)
 
@@ -300,7 +300,7 @@ class Database:
         """, (
             metric_name, metric_value,
             datetime.utcnow().isoformat(),
-            json.dumps(labels) if labels else None
+            dumps_str(labels) if labels else None
         ))
         self.conn.commit()
     
@@ -324,7 +324,7 @@ class Database:
             INSERT INTO audit_log (event_type, event_data, timestamp, user_id, ip_address)
             VALUES (?, ?, ?, ?, ?)
         """, (
-            event_type, json.dumps(event_data),
+            event_type, dumps_str(event_data),
             datetime.utcnow().isoformat(), user_id, ip_address
         ))
         self.conn.commit()
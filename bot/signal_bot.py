@@ -9,11 +9,12 @@ import time
 import yaml
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List, Tuple
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Deque, Callable
 from datetime import datetime, timedelta
 from pathlib import Path
-import hashlib
-import json
+from collections import OrderedDict, defaultdict, deque
 
 import pandas as pd
 import numpy as np
@@ -26,17 +27,92 @@ try:
 except Exception:
     # fallback compatible import name (older file)
     from bot.notifiers.telegram import TelegramNotifier, create_telegram_notifier
+    create_telegram_notifier_from_env = None
 
 from bot.utils.logger import setup_logger
 from bot.utils.env_loader import get_env_loader
+from bot.utils import kernels
+from bot.utils._njit import NUMBA_AVAILABLE
+from bot.utils.serialization import dumps as _dumps, loads as _loads
 from bot.core.price_manager import PriceManager
 
 
+logger = logging.getLogger("APEX_SIGNAL")
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics either way
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# resolved config path -> ((st_mtime_ns, st_size), parsed config); see SignalBot._load_config
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# Static parts of the batched alert notification (built once at import time)
+_ALERT_HDR = "⚠️ APEX SIGNAL BOT™ ALERTS\n━━━━━━━━━━━━━━━━━━\n"
+_ALERT_FTR = "━━━━━━━━━━━━━━━━━━\n"
+_LEVEL_ICONS = {'ERROR': '❌', 'WARNING': '⚠️', 'INFO': 'ℹ️'}
+
+# Identical errors inside this window (seconds) are coalesced into one notification
+_ERR_SUPPRESS_WINDOW = 60.0
+_ERR_SEEN_MAX = 256
+
+# 3.12+: fire-and-forget tasks from SignalBot._spawn run synchronously up to their
+# first await; only those tasks, not every task on the loop
+_EAGER_TASK_FACTORY = getattr(asyncio, 'eager_task_factory', None)
+
+# Status message templates, filled with str.format_map (cf. TelegramNotifier._SIGNAL_TEMPLATE)
+_FEED_MAX_DEVIATION = 0.0005
+_FEED_TMPL = (
+    "✅ LIVE DATA FEED CONNECTED\n"
+    "Active Source: multi\n"
+    f"Price deviation threshold: {_FEED_MAX_DEVIATION:.4%}\n"
+    "UTC: {ts}"
+)
+_STARTUP_TMPL = (
+    "🚀 APEX SIGNAL BOT STARTED\n"
+    "Mode: {mode}\n"
+    "Capital: {capital}\n"
+    "Active strategies: {n}\n"
+    "UTC: {ts}"
+)
+_SUMMARY_TMPL = (
+    "📊 APEX SIGNAL™ DAILY SUMMARY\n"
+    "Date: {date}\n"
+    "Signals: {total} (BUY {buy} / SELL {sell})\n"
+    "Avg confidence: {avg_confidence:.1f}%\n"
+    "UTC: {ts}"
+)
+
+
 class Mode:
     VERIFIED_TEST = "VERIFIED_TEST"
     LIVE_SIGNAL = "LIVE_SIGNAL"
 
 
+SCAN_COLUMNS = ("close", "high", "low", "volume", "ema_20", "ema_50", "atr_14", "vol_ma_20")
+
+
+CORE_COLUMNS = ("ema_20", "ema_50", "atr_14", "vol_ma_20")
+
+
+def scan_arrays(bars: pd.DataFrame, dtype=np.float64) -> Dict[str, np.ndarray]:
+    """Column name -> ndarray (float64 by default) for the columns scoring code reads, extracted once per scan."""
+    return {c: bars[c].to_numpy(dtype=dtype) for c in SCAN_COLUMNS if c in bars.columns}
+
+
+def _make_notifier():
+    """Notifier from TELEGRAM_BOT_TOKEN / TELEGRAM_CHAT_ID, via the env factory when the notifier module has one."""
+    if create_telegram_notifier_from_env is not None:
+        return create_telegram_notifier_from_env()
+    return TelegramNotifier(token=os.environ.get('TELEGRAM_BOT_TOKEN'), chat_id=os.environ.get('TELEGRAM_CHAT_ID'))
+
+
+# default take-profit / stop-loss levels as multiples of entry, when a strategy gives none
+_TP_MULT = (1.01, 1.02, 1.03)
+_SL_MULT = 0.99
+
+# indexed by sign(ema20 - ema50) + 1
+_TREND_SIDES = (('SELL', 'ema20 < ema50'), (None, None), ('BUY', 'ema20 > ema50'))
+
+
 # Minimal default strategy to ensure the system boots if no strategies are present.
 class DefaultTrendStrategy:
     """
@@ -49,49 +125,45 @@ class DefaultTrendStrategy:
         self.name = name
         self.params = params or {}
         self.indicators = []
-        self.logger = logging.getLogger("APEX_SIGNAL")
+        self._indicator_names: Tuple[str, ...] = ()
+        self.logger = logger
 
     def add_indicator(self, indicator):
         self.indicators.append(indicator)
+        name = getattr(indicator, 'name', None)
+        if name is not None and name not in self._indicator_names:
+            self._indicator_names += (name,)
 
     def reset(self):
         pass
 
     def generate_signal(self, bars: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        if bars is None:
+            return None
+        return self.generate_signal_from_arrays(scan_arrays(bars))
+
+    def generate_signal_from_arrays(self, arrs: Dict[str, np.ndarray]) -> Optional[Dict[str, Any]]:
         # basic crossover of EMA20/EMA50
         try:
-            if bars is None or len(bars) < 5:
+            close = arrs.get('close')
+            if close is None or len(close) < 5:
                 return None
-            latest = bars.iloc[-1]
-            ema20 = None
-            ema50 = None
-            if 'ema_20' in bars.columns:
-                ema20 = latest['ema_20']
-            if 'ema_50' in bars.columns:
-                ema50 = latest['ema_50']
-            price = float(latest['close'])
-            if ema20 is None or ema50 is None:
+            if 'ema_20' not in arrs or 'ema_50' not in arrs:
                 return None
-            if ema20 > ema50:
-                return {
-                    'strategy_name': self.name,
-                    'signal': 'BUY',
-                    'confidence': 65.0,
-                    'reason': 'ema20 > ema50',
-                    'metadata': {'ema20': ema20, 'ema50': ema50},
-                    'entry_price': price,
-                }
-            elif ema20 < ema50:
-                return {
-                    'strategy_name': self.name,
-                    'signal': 'SELL',
-                    'confidence': 65.0,
-                    'reason': 'ema20 < ema50',
-                    'metadata': {'ema20': ema20, 'ema50': ema50},
-                    'entry_price': price,
-                }
-            else:
+            ema20 = float(arrs['ema_20'][-1])
+            ema50 = float(arrs['ema_50'][-1])
+            # sign of the spread picks SELL / no signal / BUY
+            side, reason = _TREND_SIDES[(ema20 > ema50) - (ema20 < ema50) + 1]
+            if side is None:
                 return None
+            return {
+                'strategy_name': self.name,
+                'signal': side,
+                'confidence': 65.0,
+                'reason': reason,
+                'metadata': {'ema20': ema20, 'ema50': ema50},
+                'entry_price': float(close[-1]),
+            }
         except Exception as e:
             self.logger.exception("DefaultTrendStrategy error: %s", e)
             return None
@@ -99,18 +171,40 @@ class DefaultTrendStrategy:
 
 # Minimal indicators to attach if none found
 class SimpleIndicators:
+    @staticmethod
+    def _col(bars: pd.DataFrame, name: str) -> np.ndarray:
+        return bars[name].to_numpy(dtype=np.float64)
+
     @staticmethod
     def add_ema(bars: pd.DataFrame, length: int, col_name: str):
-        bars[col_name] = bars['close'].ewm(span=length, adjust=False).mean()
+        bars[col_name] = kernels.ema(SimpleIndicators._col(bars, 'close'), length)
         return bars
 
     @staticmethod
     def add_atr(bars: pd.DataFrame, length: int = 14, col_name: str = 'atr_14'):
-        high_low = bars['high'] - bars['low']
-        high_close = (bars['high'] - bars['close'].shift()).abs()
-        low_close = (bars['low'] - bars['close'].shift()).abs()
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        bars[col_name] = tr.rolling(window=length, min_periods=1).mean()
+        c = SimpleIndicators._col
+        bars[col_name] = kernels.atr(c(bars, 'high'), c(bars, 'low'), c(bars, 'close'), length)
+        return bars
+
+    @staticmethod
+    def core_arrays(arrs: Dict[str, np.ndarray],
+                    ema: Callable[[np.ndarray, int], np.ndarray] = kernels.ema) -> Dict[str, np.ndarray]:
+        """Fill ema_20, ema_50 and atr_14 (plus vol_ma_20 when volume exists) into arrs, in place."""
+        close = arrs['close']
+        arrs['ema_20'] = ema(close, 20)
+        arrs['ema_50'] = ema(close, 50)
+        arrs['atr_14'] = kernels.atr(arrs['high'], arrs['low'], close, 14)
+        if 'volume' in arrs:
+            arrs['vol_ma_20'] = kernels.rolling_mean(arrs['volume'], 20)
+        return arrs
+
+    @staticmethod
+    def add_core(bars: pd.DataFrame) -> pd.DataFrame:
+        """DataFrame form of core_arrays: adds the core indicator columns to bars."""
+        arrs = SimpleIndicators.core_arrays(scan_arrays(bars))
+        for col in CORE_COLUMNS:
+            if col in arrs:
+                bars[col] = arrs[col]
         return bars
 
 
@@ -132,10 +226,19 @@ class SignalBot:
         self.last_signal_time = None
         self.heartbeat_count = 0
         self.signal_count = 0
-        self.daily_signals = []
+        # UTC date the run loop is in; the daily summary is sent when it rolls over
+        self._summary_day = time.strftime("%Y-%m-%d", time.gmtime())
+
+        # bounded log of recent signals plus O(1) per-UTC-date counters; see _record_daily_signal
+        self.daily_signals: Deque[Dict[str, Any]] = deque(maxlen=self.config.get('daily_signals_cap', 10000))
+        self._daily_counters: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {'BUY': 0, 'SELL': 0, 'conf_sum': 0.0, 'n': 0})
 
         self.capital = self.env_loader.get_capital()
         self.risk_per_trade = self.env_loader.get_risk_per_trade()
+        # fixed for the run; reused by every signal payload and message
+        self._risk_amount = self.capital * self.risk_per_trade
+        self._capital_str = f"${self.capital:.2f}"
 
         # connectors & managers
         self.connector: Optional[MultiSourceConnector] = None
@@ -143,6 +246,8 @@ class SignalBot:
 
         # notifiers
         self.telegram_notifier = None
+        # resolved at the end of initialize; gates per-signal notifier work
+        self._notify_enabled = False
 
         # registries & components
         BaseRegistry.reset()
@@ -150,15 +255,52 @@ class SignalBot:
         self.indicator_registry = IndicatorRegistry()
         self.strategies: Dict[str, Any] = {}
         self.indicators: Dict[str, Any] = {}
-
-        self.signal_history: List[Dict[str, Any]] = []
+        # per-strategy snapshot built once after loading; see _build_scan_plan
+        self._indicator_keys: Tuple[str, ...] = ()
+        self._scan_plan: Tuple[Tuple[str, Any, Any, Tuple[Any, ...], List[str]], ...] = ()
+        self._needs_frames = False
+        self._frame_indicators: Tuple[Any, ...] = ()
+        # (symbol, indicator) -> (bar timestamps as int64 ns, ema values) from the previous scan
+        self._ewma_state: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]] = {}
+        # saved on shutdown and reloaded on start so the first scan after a restart is incremental too
+        self._ewma_state_path = Path(self.config.get('ewma_state_path', '.cache/ewma_state.json'))
+        self._ewma_state_max_age = self.config.get('ewma_state_max_age', 86400)
+
+        self.signal_history: Deque[Dict[str, Any]] = deque(maxlen=self.config.get('signal_history_cap', 1000))
         self.healthy = True
+
+        # error notification dedup: hash(error) -> last sent (monotonic), suppressed counts
+        # and the text to report them under; see _flush_suppressed_errors
+        self._err_seen: "OrderedDict[int, float]" = OrderedDict()
+        self._err_suppressed: Dict[int, int] = {}
+        self._err_text: Dict[int, str] = {}
+
+        # (epoch second, formatted UTC string) - see _utc_ts()
+        self._ts_cache: Tuple[int, str] = (0, "")
+
+        # fire-and-forget tasks, drained on shutdown
+        self._bg_tasks: set = set()
+
+        # (level, epoch seconds, text) records, coalesced by _notification_flush_loop;
+        # bounded, the oldest record is dropped when full
+        self._notify_queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.get('notification_queue_max', 500))
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # indicator arrays in float32 halve memory traffic; prices in payloads stay float64
+        self._bar_dtype = np.float32 if self.config.get('use_float32_indicators', False) else np.float64
+
+        # caps how many symbols fetch from upstream APIs at once
+        self._max_scans = self.config.get('max_concurrent_scans', 8)
+        self._scan_sem = asyncio.Semaphore(self._max_scans)
+        # dedicated threads for blocking connector calls (created in initialize), so scans
+        # neither queue behind nor starve the loop's default executor
+        self._io_pool: Optional[ThreadPoolExecutor] = None
         self.data_source_connected = False
 
         self.logger.warning("=" * 70)
         self.logger.warning("🚀 APEX SIGNAL™ BOT INITIALIZING")
         self.logger.warning(f"Mode: {self.mode}")
-        self.logger.warning(f"Capital: ${self.capital:.2f}")
+        self.logger.warning(f"Capital: {self._capital_str}")
         self.logger.warning(f"Risk per trade: {self.risk_per_trade:.2%}")
         self.logger.warning("=" * 70)
 
@@ -166,9 +308,16 @@ class SignalBot:
         try:
             cfg_file = Path(config_path)
             if cfg_file.exists():
-                with open(cfg_file, 'r') as f:
-                    cfg = yaml.safe_load(f) or {}
-                    return cfg
+                # re-parse only when the file changed; callers get their own copy to mutate
+                st = cfg_file.stat()
+                key = str(cfg_file.resolve())
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = _CONFIG_CACHE.get(key)
+                if cached is None or cached[0] != stamp:
+                    with open(cfg_file, 'r') as f:
+                        cached = (stamp, yaml.load(f, Loader=_YAML_LOADER) or {})
+                    _CONFIG_CACHE[key] = cached
+                return copy.deepcopy(cached[1])
             else:
                 self.logger.warning("Config file not found at %s (using defaults)", config_path)
                 return {}
@@ -176,6 +325,23 @@ class SignalBot:
             self.logger.exception("Error loading config: %s", e)
             return {}
 
+    def _utc_ts(self) -> str:
+        """UTC 'YYYY-mm-dd HH:MM:SS' string, formatted at most once per second."""
+        sec = int(time.time())
+        cached = self._ts_cache
+        if cached[0] != sec:
+            cached = self._ts_cache = (sec, time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(sec)))
+        return cached[1]
+
+    def _spawn(self, coro) -> asyncio.Task:
+        if _EAGER_TASK_FACTORY is not None:
+            task = _EAGER_TASK_FACTORY(asyncio.get_running_loop(), coro)
+        else:
+            task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
     def _detect_mode(self) -> str:
         token = os.environ.get('TELEGRAM_BOT_TOKEN')
         chat_id = os.environ.get('TELEGRAM_CHAT_ID')
@@ -191,6 +357,10 @@ class SignalBot:
         try:
             self.logger.info("🔧 Initializing bot components...")
 
+            # one fetch thread per concurrent scan: each holds at most a price and a bars call
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=self._max_scans, thread_name_prefix="scan-io")
+
             # connectors
             self.connector = MultiSourceConnector()
             connected = self.connector.connect()
@@ -207,23 +377,17 @@ class SignalBot:
 
             # Telegram notifier creation: config or env
             if self.mode == Mode.LIVE_SIGNAL:
-                # signal_bot previously used dict notifier_config; support both
-                token = os.environ.get('TELEGRAM_BOT_TOKEN')
-                chat_id = os.environ.get('TELEGRAM_CHAT_ID')
                 try:
-                    # try import factory
-                    self.telegram_notifier = create_telegram_notifier_from_env() if 'create_telegram_notifier_from_env' in globals() else TelegramNotifier(token=token, chat_id=chat_id)
+                    self.telegram_notifier = _make_notifier()
                 except Exception:
-                    # fallback
-                    try:
-                        self.telegram_notifier = TelegramNotifier(token=token, chat_id=chat_id)
-                    except Exception:
-                        self.telegram_notifier = None
+                    self.logger.exception("Telegram notifier creation failed")
+                    self.telegram_notifier = None
                 if self.telegram_notifier and self.telegram_notifier.is_enabled():
                     self.logger.info("✅ Telegram notifier initialized (LIVE mode)")
+                    self._flush_task = asyncio.create_task(self._notification_flush_loop())
                     # send startup notification asynchronously (do not block)
                     try:
-                        asyncio.create_task(self.send_startup_notification())
+                        self._spawn(self.send_startup_notification())
                     except Exception:
                         pass
                 else:
@@ -233,14 +397,19 @@ class SignalBot:
 
             # load strategies & indicators via registry; if none found -> fallback
             await self._load_strategies_and_indicators()
+            self._load_ewma_state()
+            if NUMBA_AVAILABLE:
+                # pay JIT compile / cache load now rather than on the first scan
+                kernels.warmup(self._bar_dtype)
 
             self.is_running = True
             self.start_time = datetime.utcnow()
             self.healthy = True
+            self._notify_enabled = bool(self.telegram_notifier and self.telegram_notifier.is_enabled())
             # non-blocking feed notification
             try:
                 if self.telegram_notifier and self.telegram_notifier.is_enabled():
-                    asyncio.create_task(self._send_feed_connected_notification())
+                    self._spawn(self._send_feed_connected_notification())
             except Exception:
                 pass
 
@@ -293,6 +462,9 @@ class SignalBot:
             # attach internal indicators to the strategy by name
             # use simple wrapper objects for compatibility
             class _IndicatorWrapper:
+                # values are precomputed once per scan by SimpleIndicators.core_arrays
+                internal = True
+
                 def __init__(self, name, fn):
                     self.name = name
                     self.fn = fn
@@ -314,16 +486,19 @@ class SignalBot:
             # If the registry provides a get() method, try to instantiate strategies enabled in config
             strategies_config = self.config.get('strategies', {})
             if strategy_count > 0 and strategies_config:
+                # indicators from config, instantiated once and shared by every strategy
+                shared_indicators = []
+                for iname in (self.config.get('indicators', {}) or {}):
+                    ival = self.indicator_registry.get(iname) if hasattr(self.indicator_registry, 'get') else None
+                    if ival:
+                        shared_indicators.append(ival(iname, {}))
                 for sname, sconf in strategies_config.items():
                     if sconf.get('enabled', False):
                         sclass = self.strategy_registry.get(sname)
                         if sclass:
                             inst = sclass(sname, sconf.get('parameters', {}))
-                            # attach indicators from config where possible
-                            for iname in (self.config.get('indicators', {}) or {}):
-                                ival = self.indicator_registry.get(iname) if hasattr(self.indicator_registry, 'get') else None
-                                if ival:
-                                    inst.add_indicator(ival(iname, {}))
+                            for ind in shared_indicators:
+                                inst.add_indicator(ind)
                             self.strategies[sname] = inst
                             self.logger.info("✅ Activated strategy from registry: %s", sname)
         except Exception as e:
@@ -338,17 +513,42 @@ class SignalBot:
             self.strategies[fallback.name] = fallback
             self.logger.warning("⚠️ Emergency fallback strategy loaded: %s", fallback.name)
 
+        self._build_scan_plan()
+
+    def _build_scan_plan(self) -> None:
+        """
+        Snapshot what _scan_symbol needs per strategy (array fast path, external
+        indicators to run, indicator names for the payload) so scans do no
+        attribute probing. External indicators are also collected once by name:
+        each is computed at most once per scan, onto one frame shared by all
+        DataFrame-path strategies.
+        """
+        self._indicator_keys = tuple(self.indicator_registry.list_all())
+        plan = []
+        for sname, strategy in self.strategies.items():
+            inds = getattr(strategy, 'indicators', [])
+            calcs = tuple(ind for ind in inds if hasattr(ind, 'calculate') and not getattr(ind, 'internal', False))
+            names = getattr(strategy, '_indicator_names', None)
+            if names is None:
+                # de-duplicated in attach order, so payloads list indicators deterministically
+                names = tuple(dict.fromkeys(ind.name for ind in inds if hasattr(ind, 'name')))
+            fast = getattr(strategy, 'generate_signal_from_arrays', None)
+            plan.append((sname, strategy, fast, calcs, names))
+        self._scan_plan = tuple(plan)
+        frame_indicators: Dict[str, Any] = {}
+        for _, _, fast, calcs, _ in plan:
+            if fast is None:
+                for ind in calcs:
+                    frame_indicators.setdefault(getattr(ind, 'name', id(ind)), ind)
+        self._frame_indicators = tuple(frame_indicators.values())
+        # only strategies without an array fast path need indicator columns on the DataFrame
+        self._needs_frames = any(fast is None for _, _, fast, _, _ in plan)
+
     async def _send_feed_connected_notification(self):
         if not self.telegram_notifier:
             return
         try:
-            status = {'active_data_source': 'multi', 'max_deviation': 0.0005}
-            msg = (
-                f"✅ LIVE DATA FEED CONNECTED\n"
-                f"Active Source: {status['active_data_source']}\n"
-                f"Price deviation threshold: {status['max_deviation']:.4%}\n"
-                f"UTC: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}"
-            )
+            msg = _FEED_TMPL.format_map({'ts': self._utc_ts()})
             await self.telegram_notifier._send(msg) if hasattr(self.telegram_notifier, '_send') else None
         except Exception:
             pass
@@ -357,13 +557,10 @@ class SignalBot:
         if not self.telegram_notifier:
             return
         try:
-            txt = (
-                f"🚀 APEX SIGNAL BOT STARTED\n"
-                f"Mode: {self.mode}\n"
-                f"Capital: ${self.capital:.2f}\n"
-                f"Active strategies: {len(self.strategies)}\n"
-                f"UTC: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}"
-            )
+            txt = _STARTUP_TMPL.format_map({
+                'mode': self.mode, 'capital': self._capital_str,
+                'n': len(self.strategies), 'ts': self._utc_ts(),
+            })
             await self.telegram_notifier._send(txt)
         except Exception:
             pass
@@ -371,97 +568,338 @@ class SignalBot:
     async def run(self):
         self.logger.info("🚀 Starting main bot loop...")
         self.is_running = True
+        scan_interval = self.config.get('scan_interval', 60)
+        # config is fixed for the run: resolve the symbol list once, not every cycle
+        symbols = tuple(self.config.get('symbols', ['BTC/USD','ETH/USD','GOLD/USD']))
+        # fixed-rate schedule: scan time does not push later cycles back
+        deadline = time.monotonic()
         try:
             while self.is_running:
                 self.heartbeat_count += 1
-                now = datetime.utcnow()
-                for symbol in self.config.get('symbols', ['BTC/USD','ETH/USD','GOLD/USD']):
-                    try:
-                        await self._scan_symbol(symbol)
-                    except Exception as e:
-                        self.logger.exception("Error scanning %s: %s", symbol, e)
-                await asyncio.sleep(self.config.get('scan_interval', 60))
+                self._flush_suppressed_errors()
+                today = self._utc_ts()[:10]
+                if today != self._summary_day:
+                    ended, self._summary_day = self._summary_day, today
+                    self._spawn(self._send_daily_summary(ended))
+                # one batched bars request per cycle, overlapping the per-symbol price fetches;
+                # scan all symbols concurrently so their network round-trips overlap
+                bars_batch = asyncio.ensure_future(self._fetch_bars_batch(symbols))
+                try:
+                    results = await asyncio.gather(
+                        *(self._scan_symbol_limited(s, bars_batch) for s in symbols), return_exceptions=True)
+                finally:
+                    bars_batch.cancel()
+                for symbol, result in zip(symbols, results):
+                    if isinstance(result, Exception):
+                        self.logger.error("Error scanning %s: %s", symbol, result, exc_info=result)
+                deadline += scan_interval
+                now = time.monotonic()
+                if deadline < now - scan_interval:
+                    # fell more than a cycle behind; skip missed ticks instead of bursting
+                    deadline = now
+                await asyncio.sleep(max(0.0, deadline - now))
         except asyncio.CancelledError:
             self.logger.info("Bot loop cancelled")
         finally:
             await self.shutdown()
 
-    async def _scan_symbol(self, symbol: str):
+    async def _fetch_bars_batch(self, symbols: List[str]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Bars for all symbols via one connector.fetch_bars_batch call; None means
+        fetch per symbol. Only used when a source has a real multi-symbol
+        endpoint: the default batch is a serial fetch_bars loop in one thread,
+        slower than the concurrent per-symbol fetches.
+        """
+        batch = getattr(self.connector, 'fetch_bars_batch', None)
+        has_batch = getattr(self.connector, 'has_bars_batch', None)
+        if batch is None or has_batch is None or not self.price_manager or not self._scan_plan:
+            return None
+        if not has_batch():
+            return None
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._io_pool, batch, symbols, '1h', 200)
+        except Exception as e:
+            self.logger.warning("Batched bar fetch failed, fetching per symbol: %s", e)
+            return None
+
+    async def _scan_symbol_limited(self, symbol: str, bars_batch: Optional[asyncio.Future] = None):
+        async with self._scan_sem:
+            await self._scan_symbol(symbol, bars_batch)
+
+    async def _scan_symbol(self, symbol: str, bars_batch: Optional[asyncio.Future] = None):
         try:
-            if not self.price_manager:
+            # nothing can fire: skip the price/bars fetches and indicator work entirely
+            if not self.price_manager or not self._scan_plan:
                 return
-            price_data = self.price_manager.get_price(symbol)
+            # blocking HTTP calls run in worker threads so the loop stays responsive
+            loop = asyncio.get_running_loop()
+            price_data = await loop.run_in_executor(self._io_pool, self.price_manager.get_price, symbol)
             if price_data is None:
                 self.logger.warning("No price data for %s", symbol)
                 return
             price = price_data.get('price') or price_data.get('last') or None
             if price is None:
                 return
-            # fetch bars
-            bars = self.connector.fetch_bars(symbol, '1h', limit=200) if hasattr(self.connector, 'fetch_bars') else pd.DataFrame()
+            # fetch bars: from this cycle's batch when there is one, else per symbol
+            bars_map = await bars_batch if bars_batch is not None else None
+            if bars_map is not None:
+                bars = bars_map.get(symbol)
+            elif hasattr(self.connector, 'fetch_bars'):
+                bars = await loop.run_in_executor(self._io_pool, self.connector.fetch_bars, symbol, '1h', 200)
+            else:
+                bars = pd.DataFrame()
             if bars is None or (isinstance(bars, pd.DataFrame) and bars.empty):
                 self.logger.warning("No bars for %s", symbol)
             else:
-                # apply any internal indicator functions attached to strategies
-                for sname, strategy in self.strategies.items():
-                    # apply attached indicator wrappers if present
+                # OHLCV columns converted to ndarrays once per symbol per scan
+                arrs = scan_arrays(bars, self._bar_dtype)
+                if self.indicators:
+                    # internal EMA/ATR, shared by every strategy below
+                    if isinstance(bars.index, pd.DatetimeIndex):
+                        ts = bars.index.asi8
+                        SimpleIndicators.core_arrays(
+                            arrs, lambda close, n: self.update_ema(symbol, f"ema_{n}", close, ts, 2.0 / (n + 1.0)))
+                    else:
+                        SimpleIndicators.core_arrays(arrs)
+                    if self._needs_frames:
+                        for col in CORE_COLUMNS:
+                            if col in arrs:
+                                bars[col] = arrs[col]
+                # one indicator frame per scan, built on first use
+                bars_calc = None
+                for sname, strategy, fast, calcs, ind_names in self._scan_plan:
                     try:
-                        # create a working copy of bars for indicator calculations
-                        bars_calc = bars.copy()
-                        if hasattr(strategy, 'indicators'):
-                            for ind in getattr(strategy, 'indicators', []):
-                                if hasattr(ind, 'calculate'):
-                                    bars_calc = ind.calculate(bars_calc)
-                        signal = strategy.generate_signal(bars_calc)
-                        if signal and signal.get('signal') in ('BUY','SELL'):
-                            # enrich and send
+                        if fast is not None:
+                            # reads only precomputed columns; no per-strategy DataFrame work
+                            signal = fast(arrs)
+                        else:
+                            if bars_calc is None:
+                                bars_calc = self._indicator_frame(bars)
+                            signal = strategy.generate_signal(bars_calc)
+                        side = signal.get('signal') if signal else None
+                        if side in ('BUY', 'SELL'):
+                            # enrich and send; strategy-provided levels win over the default multipliers
+                            get = signal.get
+                            tp1_m, tp2_m, tp3_m = _TP_MULT
                             signal_payload = {
                                 'symbol': symbol,
-                                'signal': signal.get('signal'),
+                                'signal': side,
                                 'price': price,
-                                'tp1': signal.get('tp') or signal.get('tp1') or (price * 1.01),
-                                'tp2': signal.get('tp2') or (price * 1.02),
-                                'tp3': signal.get('tp3') or (price * 1.03),
-                                'sl': signal.get('sl') or (price * 0.99),
-                                'confidence': signal.get('confidence', 50.0),
-                                'strategy_name': signal.get('strategy_name', sname),
-                                'indicators': list({ind.name for ind in getattr(strategy, 'indicators', []) if hasattr(ind, 'name')})
+                                'tp1': get('tp') or get('tp1') or price * tp1_m,
+                                'tp2': get('tp2') or price * tp2_m,
+                                'tp3': get('tp3') or price * tp3_m,
+                                'sl': get('sl') or price * _SL_MULT,
+                                'confidence': get('confidence', 50.0),
+                                'strategy_name': get('strategy_name', sname),
+                                'risk_amount': self._risk_amount,
+                                'indicators': ind_names
                             }
-                            # send notification (non-blocking)
-                            if self.telegram_notifier:
+                            # send notification (non-blocking); the notifier parses the payload,
+                            # scores the tier and formats the text once
+                            if self._notify_enabled:
                                 try:
-                                    self.telegram_notifier.send_notification(self.telegram_notifier._format_signal_text(Signal(**{
-                                        'symbol': signal_payload['symbol'],
-                                        'side': signal_payload['signal'],
-                                        'entry': signal_payload['price'],
-                                        'sl': signal_payload['sl'],
-                                        'tp1': signal_payload['tp1'],
-                                        'tp2': signal_payload['tp2'],
-                                        'tp3': signal_payload['tp3'],
-                                        'confidence': float(signal_payload['confidence']),
-                                        'strategy_name': signal_payload['strategy_name'],
-                                        'indicators': signal_payload['indicators']
-                                    })), signal_payload)
+                                    self.telegram_notifier.send_notification(None, signal_payload)
                                 except Exception:
-                                    # fallback to compatibility call
-                                    try:
-                                        self.telegram_notifier.send_notification(str(signal_payload), signal_payload)
-                                    except Exception:
-                                        self.logger.exception("Failed to send notification for %s", symbol)
+                                    self.logger.exception("Failed to send notification for %s", symbol)
                             # add to history
                             self.signal_history.append(signal_payload)
                             self.signal_count += 1
+                            self._record_daily_signal(signal_payload)
                     except Exception as e:
                         self.logger.exception("Strategy execution error: %s", e)
         except Exception as e:
             self.logger.exception("Scan symbol exception: %s", e)
 
+    def update_ema(self, symbol: str, name: str, closes: np.ndarray, timestamps: np.ndarray, alpha: float) -> np.ndarray:
+        """
+        EMA over closes, carried forward from the previous scan where the bar
+        windows overlap: only bars after the last bar that was already closed
+        last time are recomputed. Falls back to a full pass on a cache miss.
+        """
+        key = (symbol, name)
+        out = None
+        state = self._ewma_state.get(key)
+        if state is not None:
+            old_ts, old_vals = state
+            j = len(old_ts) - 2  # the newest bar may still have been forming last scan
+            if j >= 0:
+                k = int(np.searchsorted(timestamps, old_ts[j]))
+                if k < len(timestamps) and timestamps[k] == old_ts[j] and k <= j:
+                    out = np.empty_like(closes)
+                    out[:k + 1] = old_vals[j - k:j + 1]
+                    out[k + 1:] = kernels.ewma_continue(closes[k + 1:], alpha, old_vals[j])
+        if out is None:
+            out = kernels.ewma(closes, alpha)
+        self._ewma_state[key] = (timestamps, out)
+        return out
+
+    def _save_ewma_state(self) -> None:
+        """Write _ewma_state to disk (atomically) for the next start."""
+        if not self._ewma_state:
+            return
+        try:
+            data = {f"{symbol}|{name}": [ts.tolist(), vals.tolist()]
+                    for (symbol, name), (ts, vals) in self._ewma_state.items()}
+            path = self._ewma_state_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + '.tmp')
+            tmp.write_bytes(_dumps(data))
+            os.replace(tmp, path)
+        except Exception as e:
+            self.logger.warning("Could not save EMA state: %s", e)
+
+    def _load_ewma_state(self) -> None:
+        """Restore _ewma_state saved by a previous run, dropping entries whose last bar is too old."""
+        path = self._ewma_state_path
+        if not path.exists():
+            return
+        try:
+            data = _loads(path.read_bytes())
+        except Exception as e:
+            self.logger.warning("Could not load EMA state: %s", e)
+            return
+        cutoff = time.time_ns() - int(self._ewma_state_max_age * 1_000_000_000)
+        for key, (ts, vals) in data.items():
+            if not ts or ts[-1] < cutoff or len(ts) != len(vals):
+                continue
+            symbol, _, name = key.rpartition('|')
+            self._ewma_state[(symbol, name)] = (np.asarray(ts, dtype=np.int64), np.asarray(vals, dtype=self._bar_dtype))
+
+    def _indicator_frame(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """
+        bars with every distinct external indicator applied once. Registry
+        indicators copy their input before adding columns, so only a shallow
+        copy is taken here to keep column additions off the caller's frame.
+        """
+        frame = bars.copy(deep=False)
+        for ind in self._frame_indicators:
+            try:
+                frame = ind.calculate(frame)
+            except Exception as e:
+                self.logger.warning("Indicator %s failed: %s", getattr(ind, 'name', ind), e)
+        return frame
+
+    def _record_daily_signal(self, payload: Dict[str, Any]) -> None:
+        self.daily_signals.append(payload)
+        c = self._daily_counters[self._utc_ts()[:10]]
+        c[payload['signal']] += 1
+        c['conf_sum'] += float(payload['confidence'])
+        c['n'] += 1
+
+    def _daily_stats(self, day: Optional[str] = None) -> Dict[str, Any]:
+        """Signal counts and mean confidence for one UTC day ('YYYY-mm-dd', default: today)."""
+        day = day or self._utc_ts()[:10]
+        c = self._daily_counters.get(day)
+        if not c or not c['n']:
+            return {'date': day, 'total': 0, 'buy': 0, 'sell': 0, 'avg_confidence': 0.0}
+        return {'date': day, 'total': c['n'], 'buy': c['BUY'], 'sell': c['SELL'], 'avg_confidence': c['conf_sum'] / c['n']}
+
+    async def _send_daily_summary(self, ended: Optional[str] = None):
+        """
+        Summarize every UTC day before today that still has counters, plus
+        `ended` (the day that just rolled over, reported even without
+        signals), oldest first; their counters are dropped once reported.
+        """
+        today = self._utc_ts()[:10]
+        # ISO dates sort lexically
+        days = {d for d in self._daily_counters if d < today}
+        if ended:
+            days.add(ended)
+        reports = [self._daily_stats(day) for day in sorted(days)]
+        for day in days:
+            self._daily_counters.pop(day, None)
+        if not self.telegram_notifier:
+            return
+        for stats in reports:
+            try:
+                txt = _SUMMARY_TMPL.format_map({**stats, 'ts': self._utc_ts()})
+                await self.telegram_notifier._send(txt)
+            except Exception:
+                self.logger.exception("Failed to send daily summary")
+
     async def _send_error_notification(self, error: str):
-        if self.telegram_notifier:
+        # records are only drained by the flush loop, which runs only for an enabled notifier
+        if self._flush_task is not None:
+            h = hash(error)
+            now = time.monotonic()
+            last = self._err_seen.get(h)
+            if last is not None and now - last < _ERR_SUPPRESS_WINDOW:
+                if h not in self._err_suppressed:
+                    self._err_text[h] = error
+                self._err_suppressed[h] = self._err_suppressed.get(h, 0) + 1
+                return
+            self._err_seen[h] = now
+            self._err_seen.move_to_end(h)
+            if len(self._err_seen) > _ERR_SEEN_MAX:
+                evicted, _ = self._err_seen.popitem(last=False)
+                self._report_suppressed(evicted)
+            self._err_text.pop(h, None)
+            suppressed = self._err_suppressed.pop(h, 0)
+            if suppressed:
+                error += f" (+{suppressed} identical suppressed)"
+            self._enqueue_notification('ERROR', error)
+
+    def _flush_suppressed_errors(self, force: bool = False) -> None:
+        """
+        Report pending suppressed counts for errors whose window has expired
+        (every pending count when force), so a burst that stops is still summarized.
+        """
+        if not self._err_suppressed:
+            return
+        now = time.monotonic()
+        expired = [
+            h for h in self._err_suppressed
+            if force or now - self._err_seen.get(h, 0.0) >= _ERR_SUPPRESS_WINDOW
+        ]
+        for h in expired:
+            self._report_suppressed(h)
+
+    def _report_suppressed(self, h: int) -> None:
+        suppressed = self._err_suppressed.pop(h, 0)
+        text = self._err_text.pop(h, None)
+        if suppressed and text is not None:
+            self._enqueue_notification('ERROR', f"{text} (+{suppressed} identical suppressed)")
+
+    def _enqueue_notification(self, level: str, text: str) -> None:
+        if self._flush_task is None:
+            return
+        queue = self._notify_queue
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            self.logger.debug("Notification queue full; dropped the oldest record")
+        queue.put_nowait((level, time.time(), text))
+
+    @staticmethod
+    def _format_notification_rows(records: List[Tuple[str, float, str]]) -> str:
+        """One compact row per record: '<icon> HH:MM:SS text'."""
+        rows = [
+            _LEVEL_ICONS.get(level, '•') + " " + time.strftime("%H:%M:%S", time.gmtime(ts)) + " " + text
+            for level, ts, text in records
+        ]
+        return "\n".join(rows) + "\n"
+
+    @classmethod
+    def _format_notification_batch(cls, records: List[Tuple[str, float, str]]) -> str:
+        return _ALERT_HDR + cls._format_notification_rows(records) + _ALERT_FTR
+
+    async def _notification_flush_loop(self) -> None:
+        """Drain queued records every batch interval and send them as a single message."""
+        interval = self.config.get('notification_batch_interval', 2.0)
+        queue = self._notify_queue
+        while True:
+            records = [await queue.get()]
+            await asyncio.sleep(interval)
+            while not queue.empty():
+                records.append(queue.get_nowait())
             try:
-                self.telegram_notifier.send_notification(f"ERROR: {error}", {'signal': 'ERROR', 'reason': error})
+                # header/footer are static; the notifier reuses their encoded form
+                await self.telegram_notifier.send_framed(_ALERT_HDR, self._format_notification_rows(records), _ALERT_FTR)
             except Exception:
-                pass
+                self.logger.exception("Failed to send batched notification")
+            finally:
+                for _ in records:
+                    queue.task_done()
 
     async def shutdown(self):
         self.logger.info("🛑 Shutting down bot...")
@@ -471,3 +909,42 @@ class SignalBot:
                 self.telegram_notifier.send_heartbeat()
             except Exception:
                 pass
+        self._flush_suppressed_errors(force=True)
+        await self._flush_notifications()
+        await self._drain_background_tasks()
+        self._save_ewma_state()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._io_pool = None
+
+    async def _flush_notifications(self, timeout: float = 5.0) -> None:
+        """Let the flush loop send whatever is queued, then stop it."""
+        task = self._flush_task
+        if task is None:
+            return
+        if not task.done():
+            try:
+                await asyncio.wait_for(self._notify_queue.join(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning("Shutdown: %d queued notification(s) dropped", self._notify_queue.qsize())
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+
+    async def _drain_background_tasks(self, timeout: float = 5.0) -> None:
+        """Give pending notification tasks a bounded chance to finish before the loop closes."""
+        tasks = [t for t in self._bg_tasks if t is not asyncio.current_task()]
+        if tasks:
+            try:
+                await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning("Shutdown: %d background task(s) cancelled after %.1fs", len(tasks), timeout)
+        if self.telegram_notifier and hasattr(self.telegram_notifier, 'drain'):
+            try:
+                await self.telegram_notifier.drain(timeout)
+                await self.telegram_notifier.close()
+            except Exception:
+                self.logger.exception("Telegram drain failed")
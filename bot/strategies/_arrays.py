@@ -0,0 +1,39 @@
+"""
+ndarray views of indicator Series and bar columns used by the strategies.
+Not a strategy module (the registry skips files starting with '_').
+"""
+
+from math import isnan
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+
+def indicator_array(indicators: Dict[str, Any], key: str) -> Optional[np.ndarray]:
+    """
+    indicators[key] as an ndarray, or None when absent.
+
+    Converted per call and not stored back: the caller's dict may be reused
+    for another frame or shared between threads.
+    """
+    series = indicators.get(key)
+    if series is None:
+        return None
+    return np.asarray(series)
+
+
+def last_value(indicators: Dict[str, Any], key: str) -> Any:
+    """Last value of the indicators[key] Series, or None when absent or NaN."""
+    series = indicators.get(key)
+    if series is None:
+        return None
+    value = series.iat[-1]
+    return None if isnan(value) else value
+
+
+def column_array(data: Any, column: str) -> np.ndarray:
+    """data[column] as an ndarray (a view for numeric columns, so no copy per call)."""
+    return data[column].to_numpy()
+
+
+__all__ = ['indicator_array', 'last_value', 'column_array']
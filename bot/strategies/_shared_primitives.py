@@ -0,0 +1,110 @@
+"""
+Bar-level primitives shared by the (data, indicators) strategies.
+Not a strategy module (the registry skips files starting with '_').
+
+compute_primitives turns an OHLCV frame into ndarrays once -- rolling
+highs/lows, mean volume, the EMA stack and MACD, plus any indicator
+Series the caller already has -- and strategies that implement
+generate_signal_from_primitives(primitives, i) read bar i from them
+without touching pandas.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from bot.utils import kernels
+
+
+def rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Max over each trailing `window` values (NaN until the window is full).
+    Keeps a deque of indices with decreasing values, so each element is
+    pushed and popped at most once.
+    """
+    out = np.full(len(values), np.nan)
+    q = deque()
+    for i, x in enumerate(values.tolist()):
+        while q and q[0][0] <= i - window:
+            q.popleft()
+        while q and q[-1][1] <= x:
+            q.pop()
+        q.append((i, x))
+        if i >= window - 1:
+            out[i] = q[0][1]
+    return out
+
+
+def rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Min over each trailing `window` values (NaN until the window is full); see rolling_max."""
+    out = np.full(len(values), np.nan)
+    q = deque()
+    for i, x in enumerate(values.tolist()):
+        while q and q[0][0] <= i - window:
+            q.popleft()
+        while q and q[-1][1] >= x:
+            q.pop()
+        q.append((i, x))
+        if i >= window - 1:
+            out[i] = q[0][1]
+    return out
+
+
+def compute_primitives(data: Any, indicators: Optional[Dict[str, Any]] = None) -> Dict[str, np.ndarray]:
+    """
+    Shared per-bar arrays for an OHLCV frame.
+
+    Keys: open_np, high_np, low_np, close_np, volume_np, roll_max_10/20,
+    roll_min_10/20 (windows include the bar itself), vol_mean_20,
+    ema_9/21/55 and macd, macd_signal, macd_hist (12/26/9), all computed
+    as the pandas indicators do (ewm(adjust=False)). Each Series in
+    indicators (aligned with data) is added under its own key as an
+    ndarray, converted once here rather than per strategy and bar.
+    """
+    p = {
+        f'{col}_np': data[col].to_numpy(dtype=np.float64)
+        for col in ('open', 'high', 'low', 'close', 'volume')
+    }
+    high, low, close, volume = p['high_np'], p['low_np'], p['close_np'], p['volume_np']
+
+    for w in (10, 20):
+        p[f'roll_max_{w}'] = rolling_max(high, w)
+        p[f'roll_min_{w}'] = rolling_min(low, w)
+
+    vol_mean = np.full(len(volume), np.nan)
+    if len(volume) >= 20:
+        vol_mean[19:] = np.convolve(volume, np.full(20, 1.0 / 20), mode='valid')
+    p['vol_mean_20'] = vol_mean
+
+    for span in (9, 21, 55):
+        p[f'ema_{span}'] = kernels.ema(close, span)
+
+    p['macd'], p['macd_signal'], p['macd_hist'] = kernels.macd(close, 12, 26, 9)
+
+    if indicators:
+        for key, series in indicators.items():
+            p[key] = np.asarray(series)
+    return p
+
+
+def bar_index(primitives: Dict[str, np.ndarray], i: int) -> int:
+    """Non-negative position of bar i (negative i counts from the end, as in indexing)."""
+    return i + len(primitives['close_np']) if i < 0 else i
+
+
+def evaluate_all(data: Any, strategies: Iterable[Any], i: int = -1,
+                 indicators: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Signals at bar i from every strategy that supports primitives,
+    computing the primitives for data (and indicators) once.
+    """
+    primitives = compute_primitives(data, indicators)
+    return [
+        strategy.generate_signal_from_primitives(primitives, i)
+        for strategy in strategies
+        if hasattr(strategy, 'generate_signal_from_primitives')
+    ]
+
+
+__all__ = ['rolling_max', 'rolling_min', 'compute_primitives', 'bar_index', 'evaluate_all']
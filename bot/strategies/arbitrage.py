@@ -5,11 +5,39 @@ Generates signals based on price discrepancies between markets.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Any, Optional
 import logging
 
 from bot.core.interfaces import Strategy
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except Exception:
+    pl = None
+    POLARS_AVAILABLE = False
+
+
+_VALID_METHODS = ('moving_average', 'vwap', 'theoretical')
+
+# (parameter, check, error message) applied by __init__ and set_parameters
+_VALIDATORS = (
+    ('fair_value_method', lambda v: v in _VALID_METHODS,
+     "fair_value_method must be one of " + str(list(_VALID_METHODS)) + ", got {}"),
+    ('fair_value_period', lambda v: v > 0, "fair_value_period must be positive, got {}"),
+    ('deviation_threshold', lambda v: v > 0, "deviation_threshold must be positive, got {}"),
+    ('min_profit_pct', lambda v: v > 0, "min_profit_pct must be positive, got {}"),
+)
+
+# signal codes returned by ArbitrageStrategy.generate_signals
+HOLD, BUY, SELL = 0, 1, 2
+
+# (signal, condition, reason wording) indexed by deviation_pct >= 0
+_ARB_SIDES = (('BUY', 'underpriced', 'below'), ('SELL', 'overpriced', 'above'))
+
+_NO_ARB_REASON = "No arbitrage opportunity: price within threshold of fair value"
+
 
 class ArbitrageStrategy(Strategy):
     """
@@ -31,6 +59,9 @@ class ArbitrageStrategy(Strategy):
     
     STRATEGY_NAME = "arbitrage"
     
+    # 'theoretical' fair value: weights for mean open, high, low, close (close weighted most)
+    THEORETICAL_WEIGHTS = np.array([0.1, 0.1, 0.1, 0.7])
+    
     def __init__(self, name: str = None, parameters: Dict[str, Any] = None):
         """
         Initialize the arbitrage strategy.
@@ -43,6 +74,10 @@ class ArbitrageStrategy(Strategy):
                 - fair_value_period (int): Period for fair value calculation (default: 20)
                 - deviation_threshold (float): Deviation threshold for signals (default: 0.02)
                 - min_profit_pct (float): Minimum profit percentage (default: 0.01)
+                - verbose (bool): Detailed reason text on HOLD signals (default: False)
+        
+        With fair_value_method='vwap', generate_signal also accepts a Polars
+        DataFrame when polars is installed.
         """
         if name is None:
             name = self.STRATEGY_NAME
@@ -53,23 +88,43 @@ class ArbitrageStrategy(Strategy):
         self.fair_value_period = self.parameters.get('fair_value_period', 20)
         self.deviation_threshold = self.parameters.get('deviation_threshold', 0.02)
         self.min_profit_pct = self.parameters.get('min_profit_pct', 0.01)
+        self.verbose = self.parameters.get('verbose', False)
         
         # Validate parameters
-        valid_methods = ['moving_average', 'vwap', 'theoretical']
-        if self.fair_value_method not in valid_methods:
-            raise ValueError(
-                f"fair_value_method must be one of {valid_methods}, "
-                f"got {self.fair_value_method}"
-            )
+        self._validate({
+            'fair_value_method': self.fair_value_method,
+            'fair_value_period': self.fair_value_period,
+            'deviation_threshold': self.deviation_threshold,
+            'min_profit_pct': self.min_profit_pct,
+        })
+        self._update_thresholds()
+        self._bind_fair_value_fn()
         
-        if self.fair_value_period <= 0:
-            raise ValueError(f"fair_value_period must be positive, got {self.fair_value_period}")
+        # moving-average fair value precomputed over a full close series (see precompute)
+        self._ma_closes: Optional[np.ndarray] = None
+        self._ma_cache: Optional[np.ndarray] = None
+        # last (frame, key, fair value) computed; see _calculate_fair_value
+        self._fv_memo: Optional[tuple] = None
+        # trailing OHLC window for the 'theoretical' fair value, reused across calls
+        self._scratch = np.empty((self.fair_value_period, 4), dtype=np.float64)
+    
+    def precompute(self, closes: np.ndarray) -> None:
+        """
+        Precompute the moving-average fair value for every bar of a close series.
         
-        if self.deviation_threshold <= 0:
-            raise ValueError(f"deviation_threshold must be positive, got {self.deviation_threshold}")
+        For callers (e.g. backtests) that run generate_signal on successive
+        prefixes of one series: each call then looks up its value instead of
+        averaging the window again.
         
-        if self.min_profit_pct <= 0:
-            raise ValueError(f"min_profit_pct must be positive, got {self.min_profit_pct}")
+        Args:
+            closes: Full close price series
+        """
+        closes = np.asarray(closes, dtype=np.float64)
+        if len(closes) < self.fair_value_period:
+            self._ma_closes = self._ma_cache = None
+            return
+        self._ma_closes = closes
+        self._ma_cache = sliding_window_view(closes, self.fair_value_period).mean(axis=-1)
     
     def generate_signal(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -88,67 +143,75 @@ class ArbitrageStrategy(Strategy):
         if self.logger:
             self.logger.debug(f"Generating arbitrage signal using {self.fair_value_method}")
         
+        # close prices read once, for the length check, fair value and current price
+        closes = np.asarray(data['close'], dtype=np.float64)
+        
         # Check if we have enough data
-        if len(data) < self.fair_value_period:
-            return self._create_hold_signal(
+        if closes.shape[0] < self.fair_value_period:
+            return self._make_signal(
+                'HOLD',
                 "Insufficient data for arbitrage analysis",
                 0.0
             )
         
         # Calculate fair value
-        fair_value = self._calculate_fair_value(data)
+        fair_value = self._calculate_fair_value(data, closes)
         
         if fair_value is None:
-            return self._create_hold_signal(
+            return self._make_signal(
+                'HOLD',
                 "Unable to calculate fair value",
                 0.0
             )
         
         # Get current price
-        current_price = data['close'].iloc[-1]
+        current_price = float(closes[-1])
         
         # Calculate deviation from fair value
         deviation_pct = ((current_price - fair_value) / fair_value) * 100
         
         # Generate signals based on deviation
-        if abs(deviation_pct) >= self.deviation_threshold * 100:
+        if abs(deviation_pct) >= self._dev_thresh_pct:
             # Check if profit opportunity meets minimum
             profit_pct = abs(deviation_pct)
             
-            if profit_pct >= self.min_profit_pct * 100:
+            if profit_pct >= self._min_profit_pct100:
                 # Calculate confidence based on deviation size
-                confidence = min(0.5 + (profit_pct / (self.deviation_threshold * 100)) * 0.4, 0.95)
+                confidence = min(0.5 + profit_pct * self._dev_thresh_inv, 0.95)
                 
-                if deviation_pct < 0:
-                    # Price below fair value - BUY
-                    return self._create_buy_signal(
-                        f"Arbitrage opportunity: Price {current_price:.2f} is "
-                        f"{abs(deviation_pct):.2f}% below fair value {fair_value:.2f}",
-                        confidence,
-                        {
-                            'current_price': current_price,
-                            'fair_value': fair_value,
-                            'deviation_pct': deviation_pct,
-                            'profit_potential': abs(deviation_pct),
-                            'method': self.fair_value_method,
-                            'condition': 'underpriced'
-                        }
-                    )
-                else:
-                    # Price above fair value - SELL
-                    return self._create_sell_signal(
-                        f"Arbitrage opportunity: Price {current_price:.2f} is "
-                        f"{deviation_pct:.2f}% above fair value {fair_value:.2f}",
-                        confidence,
-                        {
-                            'current_price': current_price,
-                            'fair_value': fair_value,
-                            'deviation_pct': deviation_pct,
-                            'profit_potential': abs(deviation_pct),
-                            'method': self.fair_value_method,
-                            'condition': 'overpriced'
-                        }
-                    )
+                # below fair value -> BUY (underpriced), otherwise SELL (overpriced)
+                side, condition, where = _ARB_SIDES[deviation_pct >= 0]
+                return self._make_signal(
+                    side,
+                    f"Arbitrage opportunity: Price {current_price:.2f} is "
+                    f"{profit_pct:.2f}% {where} fair value {fair_value:.2f}",
+                    confidence,
+                    {
+                        'current_price': current_price,
+                        'fair_value': fair_value,
+                        'deviation_pct': deviation_pct,
+                        'profit_potential': profit_pct,
+                        'method': self.fair_value_method,
+                        'condition': condition
+                    }
+                )
+            
+            # deviation clears the threshold but not the minimum profit
+            where = _ARB_SIDES[deviation_pct >= 0][2]
+            return self._make_signal(
+                'HOLD',
+                f"Price {current_price:.2f} is {profit_pct:.2f}% {where} fair value "
+                f"{fair_value:.2f}, below minimum profit {self._min_profit_pct100:.2f}%",
+                0.5,
+                {
+                    'current_price': current_price,
+                    'fair_value': fair_value,
+                    'deviation_pct': deviation_pct,
+                    'profit_potential': profit_pct,
+                    'method': self.fair_value_method,
+                    'condition': 'below_min_profit'
+                }
+            )
         
         # No arbitrage opportunity - HOLD
         else:
@@ -163,9 +226,20 @@ class ArbitrageStrategy(Strategy):
                 condition = "slightly_underpriced"
                 confidence = 0.6
             
-            return self._create_hold_signal(
-                f"No arbitrage opportunity: Price {current_price:.2f} is "
-                f"within {abs(deviation_pct):.2f}% of fair value {fair_value:.2f}",
+            # HOLD is the common case: format the detailed reason only when it will be read
+            if self.verbose or (self.logger and self.logger.isEnabledFor(logging.DEBUG)):
+                reason = (
+                    f"No arbitrage opportunity: Price {current_price:.2f} is "
+                    f"within {abs(deviation_pct):.2f}% of fair value {fair_value:.2f}"
+                )
+                if self.logger:
+                    self.logger.debug(reason)
+            else:
+                reason = _NO_ARB_REASON
+            
+            return self._make_signal(
+                'HOLD',
+                reason,
                 confidence,
                 {
                     'current_price': current_price,
@@ -176,65 +250,163 @@ class ArbitrageStrategy(Strategy):
                 }
             )
     
-    def _calculate_fair_value(self, data: pd.DataFrame) -> float:
+    def generate_signals(self, data: pd.DataFrame) -> np.ndarray:
         """
-        Calculate fair value based on the specified method.
+        Signal codes for every bar in one pass.
+        
+        Element i equals what generate_signal(data.iloc[:i + 1]) decides,
+        as HOLD (0), BUY (1) or SELL (2), without building signal dicts.
         
         Args:
-            data: OHLCV DataFrame
+            data: OHLCV DataFrame with columns: ['open', 'high', 'low', 'close', 'volume']
             
         Returns:
-            Fair value price
+            int8 array of signal codes, one per row of data
         """
-        if self.fair_value_method == 'moving_average':
-            # Use simple moving average of close prices
-            return data['close'].rolling(window=self.fair_value_period).mean().iloc[-1]
+        closes = np.asarray(data['close'], dtype=np.float64)
+        n = closes.shape[0]
+        p = self.fair_value_period
+        signals = np.zeros(n, dtype=np.int8)
+        if n < p:
+            return signals
         
+        fair_value = np.full(n, np.nan)
+        if self.fair_value_method == 'moving_average':
+            fair_value[p - 1:] = sliding_window_view(closes, p).mean(axis=-1)
         elif self.fair_value_method == 'vwap':
-            # Volume Weighted Average Price
-            typical_price = (data['high'] + data['low'] + data['close']) / 3
-            vwap = (typical_price * data['volume']).sum() / data['volume'].sum()
-            return vwap
-        
-        elif self.fair_value_method == 'theoretical':
-            # Theoretical fair value (simplified model)
-            # In practice, this would use more sophisticated models
-            # Here we use a weighted average of recent OHLC
-            weights = np.array([0.1, 0.1, 0.1, 0.7])  # Weight close price more
-            recent_ohlc = data[['open', 'high', 'low', 'close']].tail(self.fair_value_period).mean()
-            return (recent_ohlc.values * weights).sum()
+            # VWAP of each prefix: running sums of price * volume over running volume
+            high, low, volume = (
+                data[c].to_numpy(dtype=np.float64, copy=False)
+                for c in ('high', 'low', 'volume')
+            )
+            hlc = np.add(high, low)
+            np.add(hlc, closes, out=hlc)
+            fair_value[p - 1:] = (np.cumsum(hlc * volume) / (3.0 * np.cumsum(volume)))[p - 1:]
+        else:
+            ohlc = data[['open', 'high', 'low', 'close']].to_numpy(dtype=np.float64)
+            window_means = np.nanmean(sliding_window_view(ohlc, p, axis=0), axis=-1)
+            fair_value[p - 1:] = window_means @ self.THEORETICAL_WEIGHTS
         
-        return None
+        deviation_pct = (closes - fair_value) / fair_value * 100
+        profit_pct = np.abs(deviation_pct)
+        active = (profit_pct >= self._dev_thresh_pct) & (profit_pct >= self._min_profit_pct100)
+        signals[active] = np.where(deviation_pct[active] < 0, BUY, SELL)
+        return signals
     
-    def _create_buy_signal(self, reason: str, confidence: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a BUY signal."""
+    def _calculate_fair_value(self, data: pd.DataFrame, closes: Optional[np.ndarray] = None) -> float:
+        """
+        Calculate fair value based on the specified method.
+        
+        The last result is remembered for the same frame object (held, so its
+        identity cannot be reused) with the same method, period, length, last
+        index label and last close, so repeated calls on one window (several
+        consumers per bar) compute it once. A different frame with matching
+        values, e.g. another symbol, is always recomputed.
+        
+        Args:
+            data: OHLCV DataFrame
+            closes: data['close'] as a float64 ndarray, when the caller has it
+            
+        Returns:
+            Fair value price
+        """
+        if closes is None:
+            closes = np.asarray(data['close'], dtype=np.float64)
+        index = getattr(data, 'index', None)
+        if index is None or len(index) == 0:
+            return self._compute_fair_value(data, closes)
+        key = (self.fair_value_method, self.fair_value_period, len(index), index[-1], closes[-1])
+        memo = self._fv_memo
+        if memo is not None and memo[0] is data and memo[1] == key:
+            return memo[2]
+        value = self._compute_fair_value(data, closes)
+        self._fv_memo = (data, key, value)
+        return value
+    
+    def _compute_fair_value(self, data: pd.DataFrame, closes: np.ndarray) -> float:
+        """Fair value for the configured method, uncached (see _calculate_fair_value)."""
+        return self._fair_value_fn(data, closes)
+    
+    def _bind_fair_value_fn(self) -> None:
+        """Resolve fair_value_method to its implementation once, not on every call."""
+        self._fair_value_fn = {
+            'moving_average': self._fv_moving_average,
+            'vwap': self._fv_vwap,
+            'theoretical': self._fv_theoretical,
+        }[self.fair_value_method]
+    
+    def _fv_moving_average(self, data: pd.DataFrame, closes: np.ndarray) -> float:
+        # Simple moving average of close prices; only the latest value is
+        # needed, so average the trailing window instead of rolling the full series
+        cache = self._ma_cache
+        if cache is not None:
+            # data is taken to be a prefix of the precomputed series when its
+            # averaging window matches the series there (O(period) check)
+            p = self.fair_value_period
+            n = len(closes)
+            i = n - p
+            if 0 <= i < len(cache) and np.array_equal(closes[-p:], self._ma_closes[i:n]):
+                return float(cache[i])
+        return float(closes[-self.fair_value_period:].mean())
+    
+    def _fv_vwap(self, data: pd.DataFrame, closes: np.ndarray) -> float:
+        if POLARS_AVAILABLE and isinstance(data, pl.DataFrame):
+            # Arrow-backed frame: the whole reduction runs as one Polars expression
+            return data.select(
+                ((pl.col('high') + pl.col('low') + pl.col('close')) / 3 * pl.col('volume')).sum()
+                / pl.col('volume').sum()
+            ).item()
+        # Volume Weighted Average Price over the frame, reduced on ndarrays:
+        # h + l + c accumulates in one buffer, sum(tp * v) is a single dot
+        # product and the /3 is folded into the final division
+        high, low, volume = (
+            data[c].to_numpy(dtype=np.float64, copy=False)
+            for c in ('high', 'low', 'volume')
+        )
+        hlc = np.add(high, low)
+        np.add(hlc, closes, out=hlc)
+        return float(np.dot(hlc, volume) / (3.0 * volume.sum()))
+    
+    def _fv_theoretical(self, data: pd.DataFrame, closes: np.ndarray) -> float:
+        # Theoretical fair value (simplified model)
+        # In practice, this would use more sophisticated models
+        # Here we use a weighted average of recent OHLC
+        p = self.fair_value_period
+        if len(data) < p:
+            recent_ohlc = data[['open', 'high', 'low', 'close']].to_numpy(dtype=np.float64)
+        else:
+            # copy only the trailing window, column by column, into the preallocated buffer
+            recent_ohlc = self._scratch
+            for j, col in enumerate(('open', 'high', 'low', 'close')):
+                np.copyto(recent_ohlc[:, j], data[col].to_numpy()[-p:])
+        return float(np.dot(np.nanmean(recent_ohlc, axis=0), self.THEORETICAL_WEIGHTS))
+    
+    def _make_signal(self, signal: str, reason: str, confidence: float,
+                     metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Create a BUY / SELL / HOLD signal dict, with confidence clamped to [0, 1]."""
+        if not 0.0 <= confidence <= 1.0:
+            confidence = 0.0 if confidence < 0.0 else 1.0
         return {
             'strategy_name': self.name,
-            'signal': 'BUY',
-            'confidence': max(0.0, min(1.0, confidence)),
+            'signal': signal,
+            'confidence': confidence,
             'reason': reason,
-            'metadata': metadata
+            'metadata': metadata if metadata is not None else {}
         }
     
-    def _create_sell_signal(self, reason: str, confidence: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a SELL signal."""
-        return {
-            'strategy_name': self.name,
-            'signal': 'SELL',
-            'confidence': max(0.0, min(1.0, confidence)),
-            'reason': reason,
-            'metadata': metadata
-        }
+    def _update_thresholds(self) -> None:
+        """Thresholds in percent, as compared in generate_signal; refreshed on parameter changes."""
+        self._dev_thresh_pct = self.deviation_threshold * 100.0
+        self._min_profit_pct100 = self.min_profit_pct * 100.0
+        # confidence grows by 0.4 per threshold-width of deviation
+        self._dev_thresh_inv = 0.4 / self._dev_thresh_pct
     
-    def _create_hold_signal(self, reason: str, confidence: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a HOLD signal."""
-        return {
-            'strategy_name': self.name,
-            'signal': 'HOLD',
-            'confidence': max(0.0, min(1.0, confidence)),
-            'reason': reason,
-            'metadata': metadata
-        }
+    @staticmethod
+    def _validate(values: Dict[str, Any]) -> None:
+        """Raise ValueError for the first value in values that fails its _VALIDATORS check."""
+        for key, check, message in _VALIDATORS:
+            if key in values and not check(values[key]):
+                raise ValueError(message.format(values[key]))
     
     def set_parameters(self, parameters: Dict[str, Any]) -> None:
         """
@@ -243,28 +415,25 @@ class ArbitrageStrategy(Strategy):
         Args:
             parameters: Dictionary of parameter names and values to update
         """
-        valid_methods = ['moving_average', 'vwap', 'theoretical']
+        # everything is checked before anything is applied
+        self._validate(parameters)
         
         for key, value in parameters.items():
-            if key == 'fair_value_method':
-                if value not in valid_methods:
-                    raise ValueError(
-                        f"fair_value_method must be one of {valid_methods}, "
-                        f"got {value}"
-                    )
+            if key in ('fair_value_method', 'fair_value_period', 'deviation_threshold', 'min_profit_pct'):
                 setattr(self, key, value)
                 self.parameters[key] = value
-            elif key == 'fair_value_period':
-                if value <= 0:
-                    raise ValueError(f"fair_value_period must be positive, got {value}")
-                setattr(self, key, value)
-                self.parameters[key] = value
-            elif key in ['deviation_threshold', 'min_profit_pct']:
-                if value <= 0:
-                    raise ValueError(f"{key} must be positive, got {value}")
-                setattr(self, key, value)
+                if key == 'fair_value_period':
+                    # precomputed averages and the scratch window were for the old period
+                    self._ma_closes = self._ma_cache = None
+                    self._scratch = np.empty((value, 4), dtype=np.float64)
+                elif key == 'fair_value_method':
+                    self._bind_fair_value_fn()
+            elif key == 'verbose':
+                self.verbose = bool(value)
                 self.parameters[key] = value
         
+        self._update_thresholds()
+        
         if self.logger:
             self.logger.info(f"Updated parameters: {self.parameters}")
 
@@ -346,6 +515,7 @@ if __name__ == "__main__":
     print("\nTest 3: Signal History Analysis")
     signals_history = []
     deviations = []
+    strategy1.precompute(test_data['close'].to_numpy())
     
     for i in range(30, len(test_data)):  # Start from where we have enough data
         window_data = test_data.iloc[:i+1]
@@ -1,6 +1,33 @@
 """ATR Volatility Breakout strategy."""
 
+from typing import Tuple
+
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import indicator_array
+
+# signal codes returned by atr_breakout
+HOLD, BUY, SELL = 0, 1, 2
+_SIDES = ('HOLD', 'BUY', 'SELL')
+_REASONS = {
+    (BUY, 'spike'): 'High volatility breakout, ATR: {atr:.2f}',
+    (SELL, 'spike'): 'High volatility breakdown, ATR: {atr:.2f}',
+    (BUY, 'range'): 'Strong bullish move > 2x ATR',
+    (SELL, 'range'): 'Strong bearish move > 2x ATR',
+    (HOLD, None): 'Normal volatility, no breakout',
+}
+
+
+def atr_breakout(atr: float, atr_prev: float, close: float, prev_close: float,
+                 multiplier: float) -> Tuple[int, float, str]:
+    """Breakout decision on plain floats: (signal code, score, rule) with rule 'spike', 'range' or None."""
+    move = close - prev_close
+    # volatility spike: ATR up more than 20% bar over bar, in the direction of the move
+    if atr_prev and atr > atr_prev * 1.2 and move != 0:
+        return (BUY if move > 0 else SELL), 70 + (atr / close * 1000), 'spike'
+    # range expansion beyond ATR
+    if abs(move) > atr * multiplier:
+        return (BUY if move > 0 else SELL), 75, 'range'
+    return HOLD, 50, None
 
 
 class ATRVolatilityBreakoutStrategy(Strategy):
@@ -13,39 +40,21 @@ class ATRVolatilityBreakoutStrategy(Strategy):
         self.atr_period = atr_period
         self.multiplier = multiplier
         self.required_indicators = ['atr']
+        self._atr_key = f'atr_{atr_period}'
     
     def generate_signal(self, data, indicators):
         """Generate signal based on ATR volatility breakout."""
         if len(data) < self.atr_period + 5:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        atr = indicators.get(f'atr_{self.atr_period}').iloc[-1] if f'atr_{self.atr_period}' in indicators else None
-        if atr is None:
+        atr_vals = indicator_array(indicators, self._atr_key)
+        if atr_vals is None:
             return self.create_signal('HOLD', 0, 'ATR not available')
         
-        close = data['close'].iloc[-1]
-        prev_close = data['close'].iloc[-2]
-        
-        # Calculate change in ATR
-        atr_prev = indicators.get(f'atr_{self.atr_period}').iloc[-2] if f'atr_{self.atr_period}' in indicators else None
-        
-        # Volatility spike detection
-        if atr_prev and atr > atr_prev * 1.2:
-            # High volatility breakout
-            if close > prev_close:
-                score = 70 + (atr / close * 1000)
-                return self.create_signal('BUY', score, 
-                    f'High volatility breakout, ATR: {atr:.2f}')
-            elif close < prev_close:
-                score = 70 + (atr / close * 1000)
-                return self.create_signal('SELL', score,
-                    f'High volatility breakdown, ATR: {atr:.2f}')
-        
-        # Range expansion beyond ATR
-        if abs(close - prev_close) > atr * self.multiplier:
-            if close > prev_close:
-                return self.create_signal('BUY', 75, 'Strong bullish move > 2x ATR')
-            else:
-                return self.create_signal('SELL', 75, 'Strong bearish move > 2x ATR')
+        # last two bars of ATR and close, read once as floats
+        closes = data['close'].to_numpy()
+        atr = float(atr_vals[-1])
+        atr_prev = float(atr_vals[-2]) if len(atr_vals) > 1 else 0.0
         
-        return self.create_signal('HOLD', 50, 'Normal volatility, no breakout')
\ No newline at end of file
+        code, score, rule = atr_breakout(atr, atr_prev, float(closes[-1]), float(closes[-2]), self.multiplier)
+        return self.create_signal(_SIDES[code], score, _REASONS[code, rule].format(atr=atr))
@@ -1,6 +1,40 @@
 """Bollinger Band Squeeze/Breakout strategy."""
 
+from math import isnan
+from typing import Tuple
+
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import indicator_array
+
+# signal codes returned by bb_breakout
+HOLD, BUY, SELL = 0, 1, 2
+_SIDES = ('HOLD', 'BUY', 'SELL')
+_REASONS = {
+    (BUY, 80): 'BB breakout after squeeze',
+    (SELL, 80): 'BB breakdown after squeeze',
+    (HOLD, 60): 'BB squeeze detected, awaiting breakout',
+    (SELL, 60): 'Price above BB upper band',
+    (BUY, 60): 'Price below BB lower band',
+    (HOLD, 50): 'Price within BB bands',
+}
+
+
+def bb_breakout(close: float, upper: float, lower: float, bandwidth: float,
+                squeeze_threshold: float) -> Tuple[int, int]:
+    """Squeeze/breakout decision on plain floats: (signal code, score)."""
+    if bandwidth < squeeze_threshold:
+        # Squeeze detected, wait for breakout
+        if close > upper:
+            return BUY, 80
+        if close < lower:
+            return SELL, 80
+        return HOLD, 60
+    # Regular BB signals
+    if close > upper:
+        return SELL, 60
+    if close < lower:
+        return BUY, 60
+    return HOLD, 50
 
 
 class BBSqueezeBreakoutStrategy(Strategy):
@@ -12,36 +46,25 @@ class BBSqueezeBreakoutStrategy(Strategy):
         super().__init__()
         self.squeeze_threshold = squeeze_threshold
         self.required_indicators = ['bollinger_bands']
+        period = 20
+        self._band_keys = (f'bb_upper_{period}', f'bb_lower_{period}', f'bb_bandwidth_{period}')
     
     def generate_signal(self, data, indicators):
         """Generate signal based on BB squeeze and breakout."""
         if len(data) < 25:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        # Get BB data
-        period = 20
-        upper = indicators.get(f'bb_upper_{period}').iloc[-1] if f'bb_upper_{period}' in indicators else None
-        lower = indicators.get(f'bb_lower_{period}').iloc[-1] if f'bb_lower_{period}' in indicators else None
-        bandwidth = indicators.get(f'bb_bandwidth_{period}').iloc[-1] if f'bb_bandwidth_{period}' in indicators else None
-        
-        if not all([upper, lower, bandwidth]):
-            return self.create_signal('HOLD', 0, 'BB indicators not available')
-        
-        close = data['close'].iloc[-1]
-        
-        # Check for squeeze
-        if bandwidth < self.squeeze_threshold:
-            # Squeeze detected, wait for breakout
-            if close > upper:
-                return self.create_signal('BUY', 80, 'BB breakout after squeeze')
-            if close < lower:
-                return self.create_signal('SELL', 80, 'BB breakdown after squeeze')
-            return self.create_signal('HOLD', 60, 'BB squeeze detected, awaiting breakout')
-        
-        # Regular BB signals
-        if close > upper:
-            return self.create_signal('SELL', 60, 'Price above BB upper band')
-        if close < lower:
-            return self.create_signal('BUY', 60, 'Price below BB lower band')
+        # Get BB data: one lookup per band, latest value read as a float
+        bands = []
+        for key in self._band_keys:
+            arr = indicator_array(indicators, key)
+            value = float(arr[-1]) if arr is not None else None
+            # a 0.0 band or bandwidth is a value, not a missing indicator
+            if value is None or isnan(value):
+                return self.create_signal('HOLD', 0, 'BB indicators not available')
+            bands.append(value)
+        upper, lower, bandwidth = bands
         
-        return self.create_signal('HOLD', 50, 'Price within BB bands')
\ No newline at end of file
+        close = float(data['close'].to_numpy()[-1])
+        code, score = bb_breakout(close, upper, lower, bandwidth, self.squeeze_threshold)
+        return self.create_signal(_SIDES[code], score, _REASONS[code, score])
@@ -5,10 +5,96 @@ Generates signals based on price breakouts from consolidation zones.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import logging
 
 from bot.core.interfaces import Strategy
+from bot.strategies._shared_primitives import rolling_max, rolling_min
+from bot.utils._njit import njit, prange, NUMBA_AVAILABLE
+
+# signal codes returned by _breakout_core and generate_signals
+HOLD, BUY, SELL = 0, 1, 2
+_SIDES = ('HOLD', 'BUY', 'SELL')
+_SIDE_NAMES = np.array(_SIDES)
+
+# HOLD reasons used when detailed text is turned off (see BreakoutStrategy.verbose)
+_NEAR_LEVEL_REASON = "Price approaching {}, potential breakout imminent"
+_HOLD_REASONS = {
+    'near_resistance': _NEAR_LEVEL_REASON.format('resistance'),
+    'near_support': _NEAR_LEVEL_REASON.format('support'),
+}
+_RANGE_REASON = "Price consolidating in range"
+
+
+@njit(cache=True)
+def _breakout_core(high, low, close, volume, period, up_mul, dn_mul, volume_multiplier, volume_confirmation):
+    """
+    Numeric core of BreakoutStrategy.generate_signal for the last bar.
+    
+    Arrays hold at least period + 1 values; levels come from the `period`
+    bars before the last one, reduced in a single loop without slicing.
+    up_mul / dn_mul are 1 + threshold and 1 - threshold.
+    Returns (code, confidence, resistance, support, avg_volume,
+    breakout_pct, volume_confirmed); confidence is 0.0 for HOLD.
+    """
+    n = close.shape[0]
+    resistance = high[n - 1 - period]
+    support = low[n - 1 - period]
+    total_volume = 0.0
+    for i in range(n - 1 - period, n - 1):
+        if high[i] > resistance:
+            resistance = high[i]
+        if low[i] < support:
+            support = low[i]
+        total_volume += volume[i]
+    avg_volume = total_volume / period
+    
+    price = close[n - 1]
+    code = HOLD
+    breakout_pct = 0.0
+    if price > resistance * up_mul:
+        code = BUY
+        breakout_pct = (price - resistance) / resistance
+    elif price < support * dn_mul:
+        code = SELL
+        breakout_pct = (support - price) / support
+    
+    volume_confirmed = True
+    confidence = 0.0
+    if code != HOLD:
+        confidence = min(0.6 + breakout_pct * 5, 0.95)
+        if volume_confirmation:
+            volume_confirmed = volume[n - 1] > avg_volume * volume_multiplier
+            if volume_confirmed:
+                confidence = min(confidence + 0.1, 0.95)
+    return code, confidence, resistance, support, avg_volume, breakout_pct, volume_confirmed
+
+
+@njit(cache=True, parallel=True)
+def _breakout_levels(high, low, volume, period):
+    """
+    Resistance, support and average volume of the `period` bars before each
+    bar (NaN for the first `period` bars); bars are independent, so the outer
+    loop runs in parallel under numba.
+    """
+    n = high.shape[0]
+    resistance = np.full(n, np.nan)
+    support = np.full(n, np.nan)
+    avg_volume = np.full(n, np.nan)
+    for i in prange(period, n):
+        hi = high[i - period]
+        lo = low[i - period]
+        total = 0.0
+        for j in range(i - period, i):
+            if high[j] > hi:
+                hi = high[j]
+            if low[j] < lo:
+                lo = low[j]
+            total += volume[j]
+        resistance[i] = hi
+        support[i] = lo
+        avg_volume[i] = total / period
+    return resistance, support, avg_volume
 
 
 class BreakoutStrategy(Strategy):
@@ -33,6 +119,11 @@ class BreakoutStrategy(Strategy):
     
     STRATEGY_NAME = "breakout"
     
+    __slots__ = (
+        'period', 'threshold', 'volume_confirmation', 'volume_multiplier', 'verbose',
+        '_up_mul', '_dn_mul', '_up_half', '_dn_half', '_min_bars',
+    )
+    
     def __init__(self, name: str = None, parameters: Dict[str, Any] = None):
         """
         Initialize the breakout strategy.
@@ -44,6 +135,8 @@ class BreakoutStrategy(Strategy):
                 - threshold (float): Percentage threshold for breakout (default: 0.02)
                 - volume_confirmation (bool): Require volume confirmation (default: True)
                 - volume_multiplier (float): Volume multiplier for confirmation (default: 1.5)
+                - verbose (bool): Detailed reason text on HOLD signals; backtests
+                  can pass False to skip formatting it (default: True)
         """
         if name is None:
             name = self.STRATEGY_NAME
@@ -54,6 +147,7 @@ class BreakoutStrategy(Strategy):
         self.threshold = self.parameters.get('threshold', 0.02)
         self.volume_confirmation = self.parameters.get('volume_confirmation', True)
         self.volume_multiplier = self.parameters.get('volume_multiplier', 1.5)
+        self.verbose = self.parameters.get('verbose', True)
         
         # Validate parameters
         if self.period <= 0:
@@ -66,6 +160,25 @@ class BreakoutStrategy(Strategy):
             raise ValueError(
                 f"volume_multiplier must be >= 1.0, got {self.volume_multiplier}"
             )
+        
+        self._update_multipliers()
+        # bars needed: the lookback period plus the current bar
+        self._min_bars = self.period + 1
+    
+    def _update_multipliers(self) -> None:
+        """Breakout (full threshold) and near-breakout (half threshold) level multipliers."""
+        self._up_mul = 1.0 + self.threshold
+        self._dn_mul = 1.0 - self.threshold
+        self._up_half = 1.0 + self.threshold * 0.5
+        self._dn_half = 1.0 - self.threshold * 0.5
+    
+    @staticmethod
+    def _arrays(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """high, low, close and volume columns as float64 ndarrays (no copy when already float64)."""
+        return tuple(
+            data[col].to_numpy(dtype=np.float64, copy=False)
+            for col in ('high', 'low', 'close', 'volume')
+        )
     
     def generate_signal(self, data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -85,192 +198,199 @@ class BreakoutStrategy(Strategy):
             self.logger.debug(f"Generating breakout signal with period {self.period}")
         
         # Check if we have enough data
-        if len(data) < self.period + 1:
-            return self._create_hold_signal(
-                "Insufficient data for breakout analysis",
-                0.0
-            )
-        
-        # Get current and previous data
-        current = data.iloc[-1]
-        previous = data.iloc[-1-self.period:-1]
+        if len(data.index) < self._min_bars:
+            return self._make_signal(HOLD, "Insufficient data for breakout analysis", 0.0)
         
-        # Calculate support and resistance from previous period
-        resistance = previous['high'].max()
-        support = previous['low'].min()
+        # Previous period is the `period` bars before the current one
+        high, low, close, volume = self._arrays(data)
+        code, confidence, resistance, support, avg_volume, breakout_pct, volume_confirmed = _breakout_core(
+            high, low, close, volume, self.period,
+            self._up_mul, self._dn_mul, self.volume_multiplier, self.volume_confirmation
+        )
         range_size = resistance - support
         
-        # Calculate average volume from previous period
-        avg_volume = previous['volume'].mean()
-        
         # Current price and volume
-        current_price = current['close']
-        current_volume = current['volume']
-        
-        # Calculate breakout levels
-        resistance_breakout = resistance * (1 + self.threshold)
-        support_breakout = support * (1 - self.threshold)
+        current_price = close[-1]
+        current_volume = volume[-1]
+        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
         
-        # Check for bullish breakout
-        if current_price > resistance_breakout:
-            # Calculate breakout strength
-            breakout_pct = (current_price - resistance) / resistance
-            confidence = min(0.6 + breakout_pct * 5, 0.95)
-            
-            # Check volume confirmation if required
-            volume_confirmed = True
-            if self.volume_confirmation:
-                volume_confirmed = current_volume > (avg_volume * self.volume_multiplier)
-                if volume_confirmed:
-                    confidence = min(confidence + 0.1, 0.95)
-            
+        if code != HOLD:
+            bullish = code == BUY
+            level_name, level = ('resistance', resistance) if bullish else ('support', support)
             reason = (
-                f"Bullish breakout: Price ({current_price:.2f}) broke above "
-                f"resistance ({resistance:.2f}) by {(breakout_pct*100):.2f}%"
+                f"{'Bullish' if bullish else 'Bearish'} breakout: Price ({current_price:.2f}) broke "
+                f"{'above' if bullish else 'below'} {level_name} ({level:.2f}) by {(breakout_pct*100):.2f}%"
             )
             
             if self.volume_confirmation:
                 volume_status = "confirmed" if volume_confirmed else "not confirmed"
                 reason += f" - Volume {volume_status}"
             
-            return self._create_buy_signal(
+            return self._make_signal(
+                code,
                 reason,
                 confidence,
                 {
                     'price': current_price,
-                    'resistance': resistance,
-                    'breakout_level': resistance_breakout,
+                    level_name: level,
+                    'breakout_level': level * (self._up_mul if bullish else self._dn_mul),
                     'breakout_pct': breakout_pct * 100,
                     'volume_confirmed': volume_confirmed,
                     'current_volume': current_volume,
                     'avg_volume': avg_volume,
-                    'volume_ratio': current_volume / avg_volume if avg_volume > 0 else 0,
+                    'volume_ratio': volume_ratio,
                     'range_size': range_size,
-                    'condition': 'bullish_breakout'
+                    'condition': 'bullish_breakout' if bullish else 'bearish_breakout'
                 }
             )
         
-        # Check for bearish breakout
-        elif current_price < support_breakout:
-            # Calculate breakout strength
-            breakout_pct = (support - current_price) / support
-            confidence = min(0.6 + breakout_pct * 5, 0.95)
-            
-            # Check volume confirmation if required
-            volume_confirmed = True
-            if self.volume_confirmation:
-                volume_confirmed = current_volume > (avg_volume * self.volume_multiplier)
-                if volume_confirmed:
-                    confidence = min(confidence + 0.1, 0.95)
-            
-            reason = (
-                f"Bearish breakout: Price ({current_price:.2f}) broke below "
-                f"support ({support:.2f}) by {(breakout_pct*100):.2f}%"
-            )
-            
-            if self.volume_confirmation:
-                volume_status = "confirmed" if volume_confirmed else "not confirmed"
-                reason += f" - Volume {volume_status}"
-            
-            return self._create_sell_signal(
-                reason,
-                confidence,
-                {
-                    'price': current_price,
-                    'support': support,
-                    'breakout_level': support_breakout,
-                    'breakout_pct': breakout_pct * 100,
-                    'volume_confirmed': volume_confirmed,
-                    'current_volume': current_volume,
-                    'avg_volume': avg_volume,
-                    'volume_ratio': current_volume / avg_volume if avg_volume > 0 else 0,
-                    'range_size': range_size,
-                    'condition': 'bearish_breakout'
-                }
-            )
+        # No breakout - check consolidation state: position within range
+        range_position = (current_price - support) / range_size if range_size > 0 else 0.5
+        
+        # Check if near breakout levels
+        near_resistance = current_price > resistance * self._up_half
+        near_support = current_price < support * self._dn_half
         
-        # No breakout - check consolidation state
+        if near_resistance:
+            confidence = 0.6
+            condition = "near_resistance"
+        elif near_support:
+            confidence = 0.6
+            condition = "near_support"
         else:
-            # Determine position within range
-            range_position = (current_price - support) / range_size if range_size > 0 else 0.5
-            
-            # Check if near breakout levels
-            near_resistance = current_price > (resistance * (1 + self.threshold / 2))
-            near_support = current_price < (support * (1 - self.threshold / 2))
-            
-            if near_resistance:
-                confidence = 0.6
-                condition = "near_resistance"
-                reason = (
-                    f"Price ({current_price:.2f}) approaching resistance "
-                    f"({resistance:.2f}), potential breakout imminent"
-                )
-            elif near_support:
-                confidence = 0.6
-                condition = "near_support"
+            confidence = 0.5
+            if range_position > 0.6:
+                condition = "upper_range"
+            elif range_position < 0.4:
+                condition = "lower_range"
+            else:
+                condition = "middle_range"
+        
+        # HOLD is the common case: format the detailed reason only when it will be read
+        if self.verbose or (self.logger and self.logger.isEnabledFor(logging.DEBUG)):
+            if near_resistance or near_support:
+                level_name, level = ('resistance', resistance) if near_resistance else ('support', support)
                 reason = (
-                    f"Price ({current_price:.2f}) approaching support "
-                    f"({support:.2f}), potential breakout imminent"
+                    f"Price ({current_price:.2f}) approaching {level_name} "
+                    f"({level:.2f}), potential breakout imminent"
                 )
             else:
-                confidence = 0.5
-                if range_position > 0.6:
-                    condition = "upper_range"
-                elif range_position < 0.4:
-                    condition = "lower_range"
-                else:
-                    condition = "middle_range"
-                
                 reason = (
                     f"Price ({current_price:.2f}) consolidating in range "
                     f"[{support:.2f} - {resistance:.2f}], "
                     f"position: {(range_position*100):.1f}%"
                 )
+            if self.logger:
+                self.logger.debug(reason)
+        else:
+            reason = _HOLD_REASONS.get(condition, _RANGE_REASON)
+        
+        return self._make_signal(
+            HOLD,
+            reason,
+            confidence,
+            {
+                'price': current_price,
+                'support': support,
+                'resistance': resistance,
+                'range_size': range_size,
+                'range_position': range_position,
+                'current_volume': current_volume,
+                'avg_volume': avg_volume,
+                'volume_ratio': volume_ratio,
+                'condition': condition
+            }
+        )
+    
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Breakout signals for every bar in one pass.
+        
+        Row i holds what generate_signal(data.iloc[:i + 1]) decides. Rolling
+        support/resistance are computed once over the whole frame rather
+        than re-reduced for each bar.
+        
+        Args:
+            data: OHLCV DataFrame with columns: ['open', 'high', 'low', 'close', 'volume']
             
-            return self._create_hold_signal(
-                reason,
-                confidence,
-                {
-                    'price': current_price,
-                    'support': support,
-                    'resistance': resistance,
-                    'range_size': range_size,
-                    'range_position': range_position,
-                    'current_volume': current_volume,
-                    'avg_volume': avg_volume,
-                    'volume_ratio': current_volume / avg_volume if avg_volume > 0 else 0,
-                    'condition': condition
-                }
+        Returns:
+            DataFrame indexed like data with columns 'signal', 'code' (int8
+            HOLD/BUY/SELL), 'confidence', 'condition', 'resistance', 'support',
+            'avg_volume' and 'volume_confirmed' (levels are NaN and signals HOLD
+            until period + 1 bars are available)
+        """
+        high, low, close, volume = self._arrays(data)
+        n, w = len(close), self.period
+        
+        # levels for bar i come from bars i - period .. i - 1
+        if NUMBA_AVAILABLE:
+            resistance, support, avg_volume = _breakout_levels(high, low, volume, w)
+        else:
+            # without numba, the O(n) deque scans beat rescanning each window in Python
+            resistance = np.full(n, np.nan)
+            support = np.full(n, np.nan)
+            avg_volume = np.full(n, np.nan)
+            if n > w:
+                resistance[1:] = rolling_max(high, w)[:-1]
+                support[1:] = rolling_min(low, w)[:-1]
+                avg_volume[w:] = np.convolve(volume, np.full(w, 1.0 / w), mode='valid')[:-1]
+        
+        bull = close > resistance * self._up_mul
+        bear = ~bull & (close < support * self._dn_mul)
+        if self.volume_confirmation:
+            volume_confirmed = volume > avg_volume * self.volume_multiplier
+        else:
+            volume_confirmed = np.ones(n, dtype=bool)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            breakout_pct = np.where(bull, (close - resistance) / resistance, (support - close) / support)
+            range_size = resistance - support
+            range_position = np.where(range_size > 0, (close - support) / range_size, 0.5)
+        breakout_confidence = np.minimum(0.6 + breakout_pct * 5, 0.95)
+        if self.volume_confirmation:
+            breakout_confidence = np.where(
+                volume_confirmed, np.minimum(breakout_confidence + 0.1, 0.95), breakout_confidence
             )
-    
-    def _create_buy_signal(self, reason: str, confidence: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a BUY signal."""
-        return {
-            'strategy_name': self.name,
-            'signal': 'BUY',
-            'confidence': max(0.0, min(1.0, confidence)),
-            'reason': reason,
-            'metadata': metadata
-        }
-    
-    def _create_sell_signal(self, reason: str, confidence: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a SELL signal."""
-        return {
-            'strategy_name': self.name,
-            'signal': 'SELL',
-            'confidence': max(0.0, min(1.0, confidence)),
-            'reason': reason,
-            'metadata': metadata
-        }
-    
-    def _create_hold_signal(self, reason: str, confidence: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a HOLD signal."""
+        
+        # every bar classified at once, in generate_signal's branch order
+        near_resistance = close > resistance * self._up_half
+        near_support = close < support * self._dn_half
+        insufficient = np.arange(n) < w
+        codes = np.select([bull, bear], [BUY, SELL], default=HOLD).astype(np.int8)
+        confidence = np.select(
+            [insufficient, bull | bear, near_resistance | near_support],
+            [0.0, np.clip(breakout_confidence, 0.0, 1.0), 0.6],
+            default=0.5
+        )
+        condition = np.select(
+            [insufficient, bull, bear, near_resistance, near_support, range_position > 0.6, range_position < 0.4],
+            ['insufficient_data', 'bullish_breakout', 'bearish_breakout', 'near_resistance',
+             'near_support', 'upper_range', 'lower_range'],
+            default='middle_range'
+        )
+        
+        return pd.DataFrame({
+            'signal': _SIDE_NAMES[codes],
+            'code': codes,
+            'confidence': confidence,
+            'condition': condition,
+            'resistance': resistance,
+            'support': support,
+            'avg_volume': avg_volume,
+            'volume_confirmed': volume_confirmed,
+        }, index=data.index)
+    
+    def _make_signal(self, code: int, reason: str, confidence: float,
+                     metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Create a HOLD / BUY / SELL signal dict for a signal code, with confidence clamped to [0, 1]."""
+        if not 0.0 <= confidence <= 1.0:
+            confidence = 0.0 if confidence < 0.0 else 1.0
         return {
             'strategy_name': self.name,
-            'signal': 'HOLD',
-            'confidence': max(0.0, min(1.0, confidence)),
+            'signal': _SIDES[code],
+            'confidence': confidence,
             'reason': reason,
-            'metadata': metadata
+            'metadata': metadata if metadata is not None else {}
         }
     
     def set_parameters(self, parameters: Dict[str, Any]) -> None:
@@ -286,11 +406,13 @@ class BreakoutStrategy(Strategy):
                     raise ValueError(f"period must be positive, got {value}")
                 setattr(self, key, value)
                 self.parameters[key] = value
+                self._min_bars = value + 1
             elif key == 'threshold':
                 if value <= 0:
                     raise ValueError(f"threshold must be positive, got {value}")
                 setattr(self, key, value)
                 self.parameters[key] = value
+                self._update_multipliers()
             elif key == 'volume_multiplier':
                 if value < 1.0:
                     raise ValueError(
@@ -303,6 +425,9 @@ class BreakoutStrategy(Strategy):
                     raise ValueError(f"volume_confirmation must be boolean, got {type(value)}")
                 setattr(self, key, value)
                 self.parameters[key] = value
+            elif key == 'verbose':
+                self.verbose = bool(value)
+                self.parameters[key] = value
         
         if self.logger:
             self.logger.info(f"Updated parameters: {self.parameters}")
@@ -319,33 +444,29 @@ if __name__ == "__main__":
     print("=" * 60)
     
     # Generate test data with breakout
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     dates = pd.date_range(start='2024-01-01', periods=100, freq='D')
     
-    # Create price series with consolidation and breakout
+    # Create price series with consolidation and breakout, filled in place
+    prices = np.empty(100)
     # Consolidation period
-    consolidation_prices = 100 + np.random.randn(40) * 1
-    
+    prices[:40] = 100 + rng.standard_normal(40)
     # Breakout period
-    breakout_prices = 140 + np.cumsum(np.random.randn(30) * 0.5)
-    
+    prices[40:70] = 140 + np.cumsum(rng.standard_normal(30) * 0.5)
     # Continue
-    continue_prices = breakout_prices[-1] + np.cumsum(np.random.randn(30) * 1)
+    prices[70:] = prices[69] + np.cumsum(rng.standard_normal(30))
     
-    prices = np.concatenate([consolidation_prices, breakout_prices, continue_prices])
+    # Increase volume during breakout
+    volume = rng.integers(100000, 1000000, 100)
+    volume[40:61] *= 2
     
     test_data = pd.DataFrame({
-        'timestamp': dates,
         'open': prices * 0.99,
         'high': prices * 1.02,
         'low': prices * 0.98,
         'close': prices,
-        'volume': np.random.randint(100000, 1000000, 100)
-    })
-    
-    # Increase volume during breakout
-    test_data.loc[40:60, 'volume'] = test_data.loc[40:60, 'volume'] * 2
-    test_data.set_index('timestamp', inplace=True)
+        'volume': volume
+    }, index=pd.Index(dates, name='timestamp'))
     
     # Test 1: Basic signal generation
     print("\nTest 1: Basic Signal Generation")
@@ -375,16 +496,12 @@ if __name__ == "__main__":
     
     # Test 3: Signal history analysis
     print("\nTest 3: Signal History Analysis")
-    signals_history = []
-    
-    for i in range(30, len(test_data)):  # Start from where we have enough data
-        window_data = test_data.iloc[:i+1]
-        signal = strategy1.generate_signal(window_data)
-        signals_history.append(signal)
+    # One batch pass; rows from 30 on match generate_signal on each growing window
+    signals_history = strategy1.generate_signals(test_data).iloc[30:]
     
-    buy_signals = sum(1 for s in signals_history if s['signal'] == 'BUY')
-    sell_signals = sum(1 for s in signals_history if s['signal'] == 'SELL')
-    hold_signals = sum(1 for s in signals_history if s['signal'] == 'HOLD')
+    buy_signals = int((signals_history['signal'] == 'BUY').sum())
+    sell_signals = int((signals_history['signal'] == 'SELL').sum())
+    hold_signals = int((signals_history['signal'] == 'HOLD').sum())
     
     print(f"  Total signals generated: {len(signals_history)}")
     print(f"  BUY signals: {buy_signals}")
@@ -392,11 +509,18 @@ if __name__ == "__main__":
     print(f"  HOLD signals: {hold_signals}")
     
     # Show some buy signals
-    buy_signals_list = [s for s in signals_history if s['signal'] == 'BUY']
-    if buy_signals_list:
+    buy_signals_list = signals_history[signals_history['signal'] == 'BUY']
+    if len(buy_signals_list):
         print(f"\n  Sample BUY signals:")
-        for signal in buy_signals_list[:3]:
-            print(f"    - {signal['reason']}")
+        for ts, row in buy_signals_list.head(3).iterrows():
+            print(
+                f"    - {ts.date()}: price {test_data.at[ts, 'close']:.2f} above "
+                f"resistance {row['resistance']:.2f} (confidence {row['confidence']:.2f})"
+            )
+    
+    # Batch result agrees with the per-bar path
+    last = strategy1.generate_signal(test_data)
+    assert last['signal'] == signals_history['signal'].iloc[-1]
     
     # Test 4: Different threshold
     print("\nTest 4: Different Threshold (0.05)")
@@ -1,6 +1,11 @@
 """EMA Trend Stack strategy."""
 
+import numpy as np
+
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import column_array, last_value
+from bot.strategies._shared_primitives import bar_index
+from bot.utils import kernels
 
 
 class EMATrendStackStrategy(Strategy):
@@ -8,12 +13,16 @@ class EMATrendStackStrategy(Strategy):
     
     STRATEGY_NAME = "ema_trend_stack"
     
+    __slots__ = ('fast_ema', 'mid_ema', 'slow_ema', 'required_indicators', '_ema_keys')
+    
     def __init__(self, fast_ema: int = 9, mid_ema: int = 21, slow_ema: int = 55):
         super().__init__()
         self.fast_ema = fast_ema
         self.mid_ema = mid_ema
         self.slow_ema = slow_ema
         self.required_indicators = ['ema']
+        # indicator / primitive keys for the fast, mid and slow EMA
+        self._ema_keys = (f'ema_{fast_ema}', f'ema_{mid_ema}', f'ema_{slow_ema}')
     
     def generate_signal(self, data, indicators):
         """Generate signal based on EMA stack alignment."""
@@ -21,15 +30,49 @@ class EMATrendStackStrategy(Strategy):
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
         # Get EMA values
-        ema_fast = indicators.get(f'ema_{self.fast_ema}').iloc[-1] if f'ema_{self.fast_ema}' in indicators else None
-        ema_mid = indicators.get(f'ema_{self.mid_ema}').iloc[-1] if f'ema_{self.mid_ema}' in indicators else None
-        ema_slow = indicators.get(f'ema_{self.slow_ema}').iloc[-1] if f'ema_{self.slow_ema}' in indicators else None
+        fast_key, mid_key, slow_key = self._ema_keys
+        if fast_key in indicators and mid_key in indicators and slow_key in indicators:
+            ema_fast = last_value(indicators, fast_key)
+            ema_mid = last_value(indicators, mid_key)
+            ema_slow = last_value(indicators, slow_key)
+        else:
+            # not supplied by the caller: compute from closes with the EMA kernel
+            ema_fast, ema_mid, ema_slow = self._kernel_emas(data)
         
-        if not all([ema_fast, ema_mid, ema_slow]):
+        if ema_fast is None or ema_mid is None or ema_slow is None:
             return self.create_signal('HOLD', 0, 'Missing EMA indicators')
         
-        close = data['close'].iloc[-1]
-        
+        close = data['close'].iat[-1]
+        return self._stack_signal(ema_fast, ema_mid, ema_slow, close)
+    
+    def _kernel_emas(self, data):
+        """Latest fast, mid and slow EMA of the close (ewm(span, adjust=False)); None where NaN."""
+        close = np.asarray(column_array(data, 'close'), dtype=np.float64)
+        values = [kernels.ema(close, period)[-1] for period in (self.fast_ema, self.mid_ema, self.slow_ema)]
+        return [None if v != v else v for v in values]
+    
+    def set_parameters(self, parameters):
+        """Update the EMA periods (fast_ema, mid_ema, slow_ema)."""
+        for key in ('fast_ema', 'mid_ema', 'slow_ema'):
+            if key in parameters:
+                if parameters[key] <= 0:
+                    raise ValueError(f"{key} must be positive, got {parameters[key]}")
+                setattr(self, key, parameters[key])
+                self.parameters[key] = parameters[key]
+        self._ema_keys = (f'ema_{self.fast_ema}', f'ema_{self.mid_ema}', f'ema_{self.slow_ema}')
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """Same signal as generate_signal at bar i, read from compute_primitives arrays."""
+        i = bar_index(primitives, i)
+        if i + 1 < self.slow_ema:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        emas = [primitives.get(key) for key in self._ema_keys]
+        if any(ema is None for ema in emas):
+            return self.create_signal('HOLD', 0, 'Missing EMA indicators')
+        return self._stack_signal(emas[0][i], emas[1][i], emas[2][i], primitives['close_np'][i])
+    
+    def _stack_signal(self, ema_fast, ema_mid, ema_slow, close):
+        """Signal from the ordering of the three EMAs and the close."""
         # Bullish stack: fast > mid > slow
         if ema_fast > ema_mid > ema_slow:
             if close > ema_fast:
@@ -1,6 +1,8 @@
 """Fibonacci Confluence strategy."""
 
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import column_array
+from bot.strategies._shared_primitives import bar_index
 
 
 class FibonacciConfluenceStrategy(Strategy):
@@ -8,6 +10,13 @@ class FibonacciConfluenceStrategy(Strategy):
     
     STRATEGY_NAME = "fibonacci_confluence"
     
+    # retracement ratios traded (BUY at 61.8%, SELL at 38.2%) and how close counts as "at" a level
+    BUY_RATIO = 0.618
+    SELL_RATIO = 0.382
+    TOLERANCE = 0.005  # 0.5%
+    
+    __slots__ = ('required_indicators',)
+    
     def __init__(self):
         super().__init__()
         self.required_indicators = []
@@ -22,24 +31,38 @@ class FibonacciConfluenceStrategy(Strategy):
         
         # Find swing high and low
         lookback = 20
-        recent = data.tail(lookback)
-        swing_high = recent['high'].max()
-        swing_low = recent['low'].min()
-        
-        close = data['close'].iloc[-1]
-        
-        # Fibonacci levels
-        fib_382 = swing_low + (swing_high - swing_low) * 0.382
-        fib_500 = swing_low + (swing_high - swing_low) * 0.500
-        fib_618 = swing_low + (swing_high - swing_low) * 0.618
+        swing_high = column_array(data, 'high')[-lookback:].max()
+        swing_low = column_array(data, 'low')[-lookback:].min()
         
-        # Check if price at fib levels
-        tolerance = 0.005  # 0.5%
+        close = column_array(data, 'close')[-1]
+        return self._fib_signal(swing_high, swing_low, close)
+    
+    def set_parameters(self, parameters):
+        """No tunable parameters; values are only recorded in self.parameters."""
+        self.parameters.update(parameters)
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """Same signal as generate_signal at bar i, read from compute_primitives arrays."""
+        i = bar_index(primitives, i)
+        if i + 1 < 50:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        return self._fib_signal(
+            primitives['roll_max_20'][i], primitives['roll_min_20'][i], primitives['close_np'][i]
+        )
+    
+    def _fib_signal(self, swing_high, swing_low, close):
+        """Signal for a close against the retracement levels of a swing range."""
+        # Fibonacci levels (only 38.2% and 61.8% are traded)
+        swing_range = swing_high - swing_low
+        fib_382 = swing_low + swing_range * self.SELL_RATIO
+        fib_618 = swing_low + swing_range * self.BUY_RATIO
         
-        if abs(close - fib_618) / fib_618 < tolerance:
+        # Check if price at fib levels: |close - level| / level < tolerance,
+        # multiplied through (levels of a price range are positive)
+        if abs(close - fib_618) < fib_618 * self.TOLERANCE:
             return self.create_signal('BUY', 65, 'Price at 61.8% Fibonacci support')
         
-        if abs(close - fib_382) / fib_382 < tolerance:
+        if abs(close - fib_382) < fib_382 * self.TOLERANCE:
             return self.create_signal('SELL', 65, 'Price at 38.2% Fibonacci resistance')
         
         return self.create_signal('HOLD', 50, 'Price not at key Fibonacci levels')
\ No newline at end of file
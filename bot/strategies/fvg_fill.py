@@ -1,6 +1,13 @@
 """Fair Value Gap Fill strategy."""
 
+import numpy as np
+
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import column_array
+from bot.strategies._shared_primitives import bar_index
+
+# signal codes returned by generate_signals
+HOLD, BUY, SELL = 0, 1, 2
 
 
 class FVGFillStrategy(Strategy):
@@ -8,6 +15,8 @@ class FVGFillStrategy(Strategy):
     
     STRATEGY_NAME = "fvg_fill"
     
+    __slots__ = ('required_indicators',)
+    
     def __init__(self):
         super().__init__()
         self.required_indicators = []
@@ -21,22 +30,56 @@ class FVGFillStrategy(Strategy):
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
         # Look for FVG in last 3 candles
-        recent = data.tail(3)
+        high = column_array(data, 'high')
+        low = column_array(data, 'low')
+        return self._fvg_signal(high[-3], low[-3], high[-2], low[-2], column_array(data, 'close')[-1])
+    
+    def set_parameters(self, parameters):
+        """No tunable parameters; values are only recorded in self.parameters."""
+        self.parameters.update(parameters)
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """Same signal as generate_signal at bar i, read from compute_primitives arrays."""
+        i = bar_index(primitives, i)
+        if i + 1 < 3:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        high, low = primitives['high_np'], primitives['low_np']
+        return self._fvg_signal(high[i - 2], low[i - 2], high[i - 1], low[i - 1], primitives['close_np'][i])
+    
+    def generate_signals(self, data):
+        """
+        Signal codes for every bar in one pass: element i is HOLD (0), BUY (1)
+        or SELL (2) as generate_signal(data.iloc[:i + 1]) decides.
+        """
+        high, low, close = (data[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close'))
+        codes = np.zeros(len(close), dtype=np.int8)
+        if len(close) < 3:
+            return codes
         
+        # candles 1 and 2 of each three-candle window, and the closing price
+        high_0, low_0 = high[:-2], low[:-2]
+        high_1, low_1 = high[1:-1], low[1:-1]
+        close = close[2:]
+        
+        bullish = (high_1 < low_0) & (close >= high_1) & (close <= low_0)
+        bearish = (low_1 > high_0) & (close >= high_0) & (close <= low_1)
+        codes[2:] = np.select([bullish, bearish], [BUY, SELL], default=HOLD)
+        return codes
+    
+    def _fvg_signal(self, high_0, low_0, high_1, low_1, close):
+        """Signal for the close against a gap between the first two of the last three candles."""
         # Bullish FVG: gap between candle 1 high and candle 3 low
-        if recent.iloc[1]['high'] < recent.iloc[0]['low']:
-            fvg_top = recent.iloc[1]['high']
-            fvg_bottom = recent.iloc[0]['low']
-            close = data['close'].iloc[-1]
+        if high_1 < low_0:
+            fvg_top = low_0
+            fvg_bottom = high_1
             
             if close >= fvg_bottom and close <= fvg_top:
                 return self.create_signal('BUY', 65, 'Price in bullish FVG, fill expected')
         
         # Bearish FVG: gap between candle 1 low and candle 3 high
-        if recent.iloc[1]['low'] > recent.iloc[0]['high']:
-            fvg_top = recent.iloc[0]['high']
-            fvg_bottom = recent.iloc[1]['low']
-            close = data['close'].iloc[-1]
+        if low_1 > high_0:
+            fvg_top = low_1
+            fvg_bottom = high_0
             
             if close >= fvg_bottom and close <= fvg_top:
                 return self.create_signal('SELL', 65, 'Price in bearish FVG, fill expected')
@@ -1,6 +1,11 @@
 """Ichimoku Bias strategy."""
 
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import last_value
+from bot.strategies._shared_primitives import bar_index
+
+# indicator keys read by IchimokuBiasStrategy
+_ICHIMOKU_KEYS = ('ichimoku_tenkan', 'ichimoku_kijun', 'ichimoku_senkou_a', 'ichimoku_senkou_b')
 
 
 class IchimokuBiasStrategy(Strategy):
@@ -8,6 +13,8 @@ class IchimokuBiasStrategy(Strategy):
     
     STRATEGY_NAME = "ichimoku_bias"
     
+    __slots__ = ('required_indicators',)
+    
     def __init__(self):
         super().__init__()
         self.required_indicators = ['ichimoku']
@@ -17,16 +24,37 @@ class IchimokuBiasStrategy(Strategy):
         if len(data) < 30:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        tenkan = indicators.get('ichimoku_tenkan').iloc[-1] if 'ichimoku_tenkan' in indicators else None
-        kijun = indicators.get('ichimoku_kijun').iloc[-1] if 'ichimoku_kijun' in indicators else None
-        senkou_a = indicators.get('ichimoku_senkou_a').iloc[-1] if 'ichimoku_senkou_a' in indicators else None
-        senkou_b = indicators.get('ichimoku_senkou_b').iloc[-1] if 'ichimoku_senkou_b' in indicators else None
+        tenkan = last_value(indicators, 'ichimoku_tenkan')
+        kijun = last_value(indicators, 'ichimoku_kijun')
+        senkou_a = last_value(indicators, 'ichimoku_senkou_a')
+        senkou_b = last_value(indicators, 'ichimoku_senkou_b')
         
-        if not all([tenkan, kijun, senkou_a, senkou_b]):
+        if tenkan is None or kijun is None or senkou_a is None or senkou_b is None:
             return self.create_signal('HOLD', 0, 'Ichimoku indicators not available')
         
-        close = data['close'].iloc[-1]
-        
+        close = data['close'].iat[-1]
+        return self._bias_signal(tenkan, kijun, senkou_a, senkou_b, close)
+    
+    def set_parameters(self, parameters):
+        """No tunable parameters; values are only recorded in self.parameters."""
+        self.parameters.update(parameters)
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """
+        Same signal as generate_signal at bar i, reading the Ichimoku lines
+        passed to compute_primitives as indicators.
+        """
+        i = bar_index(primitives, i)
+        if i + 1 < 30:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        lines = [primitives.get(key) for key in _ICHIMOKU_KEYS]
+        if any(line is None or line[i] != line[i] for line in lines):
+            return self.create_signal('HOLD', 0, 'Ichimoku indicators not available')
+        tenkan, kijun, senkou_a, senkou_b = (line[i] for line in lines)
+        return self._bias_signal(tenkan, kijun, senkou_a, senkou_b, primitives['close_np'][i])
+    
+    def _bias_signal(self, tenkan, kijun, senkou_a, senkou_b, close):
+        """Signal from the close against the cloud and the Tenkan/Kijun cross."""
         # Cloud top and bottom
         cloud_top = max(senkou_a, senkou_b)
         cloud_bottom = min(senkou_a, senkou_b)
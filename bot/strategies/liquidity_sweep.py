@@ -1,6 +1,15 @@
 """Liquidity Sweep Detection strategy (stub)."""
 
+import numpy as np
+
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import column_array
+from bot.strategies._shared_primitives import bar_index, rolling_max, rolling_min
+
+# signal codes returned by generate_signals
+HOLD, BUY, SELL = 0, 1, 2
+# the sweep compares the current bar with this many bars before it
+LOOKBACK = 10
 
 
 class LiquiditySweepStrategy(Strategy):
@@ -8,6 +17,8 @@ class LiquiditySweepStrategy(Strategy):
     
     STRATEGY_NAME = "liquidity_sweep"
     
+    __slots__ = ('required_indicators',)
+    
     def __init__(self):
         super().__init__()
         self.required_indicators = []
@@ -20,17 +31,57 @@ class LiquiditySweepStrategy(Strategy):
         - Detect sweeps of previous highs/lows
         - Identify institutional footprints
         """
-        if len(data) < 10:
+        if len(data) < LOOKBACK + 1:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        close = data['close'].iloc[-1]
-        high = data['high'].iloc[-1]
-        low = data['low'].iloc[-1]
+        highs = column_array(data, 'high')
+        lows = column_array(data, 'low')
+        close = column_array(data, 'close')[-1]
+        high = highs[-1]
+        low = lows[-1]
         
-        # Check for sweep of recent high/low
-        recent_high = data['high'].tail(10).max()
-        recent_low = data['low'].tail(10).min()
+        # Check for sweep of the high/low of the bars before this one
+        recent_high = highs[-1 - LOOKBACK:-1].max()
+        recent_low = lows[-1 - LOOKBACK:-1].min()
+        return self._sweep_signal(high, low, close, recent_high, recent_low)
+    
+    def set_parameters(self, parameters):
+        """No tunable parameters; values are only recorded in self.parameters."""
+        self.parameters.update(parameters)
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """Same signal as generate_signal at bar i, read from compute_primitives arrays."""
+        i = bar_index(primitives, i)
+        if i + 1 < LOOKBACK + 1:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        return self._sweep_signal(
+            primitives['high_np'][i], primitives['low_np'][i], primitives['close_np'][i],
+            primitives['roll_max_10'][i - 1], primitives['roll_min_10'][i - 1]
+        )
+    
+    def generate_signals(self, data):
+        """
+        Signal codes for every bar in one pass: element i is HOLD (0), BUY (1)
+        or SELL (2) as generate_signal(data.iloc[:i + 1]) decides.
+        """
+        high, low, close = (data[col].to_numpy(dtype=np.float64) for col in ('high', 'low', 'close'))
+        n = len(close)
+        codes = np.zeros(n, dtype=np.int8)
+        if n < LOOKBACK + 1:
+            return codes
         
+        # extremes of the LOOKBACK bars before each bar
+        recent_high = rolling_max(high, LOOKBACK)[LOOKBACK - 1:-1]
+        recent_low = rolling_min(low, LOOKBACK)[LOOKBACK - 1:-1]
+        high, low, close = high[LOOKBACK:], low[LOOKBACK:], close[LOOKBACK:]
+        
+        sweep_high = (high > recent_high) & (close < high * 0.999)
+        sweep_low = (low < recent_low) & (close > low * 1.001)
+        codes[LOOKBACK:] = np.select([sweep_high, sweep_low], [SELL, BUY], default=HOLD)
+        return codes
+    
+    def _sweep_signal(self, high, low, close, recent_high, recent_low):
+        """Signal for the current bar against the recent high/low."""
         # Sweep high
         if high > recent_high and close < high * 0.999:
             return self.create_signal('SELL', 65, 'Liquidity sweep above recent high')
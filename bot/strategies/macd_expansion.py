@@ -1,6 +1,13 @@
 """MACD Expansion strategy."""
 
+from math import isnan
+
+import numpy as np
+
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import column_array, last_value
+from bot.strategies._shared_primitives import bar_index
+from bot.utils import kernels
 
 
 class MACDExpansionStrategy(Strategy):
@@ -8,6 +15,13 @@ class MACDExpansionStrategy(Strategy):
     
     STRATEGY_NAME = "macd_expansion"
     
+    # indicator keys of the MACD(12, 26, 9) line, signal line and histogram
+    MACD_KEY = 'macd_12_26_9'
+    SIGNAL_KEY = f'{MACD_KEY}_signal'
+    HISTOGRAM_KEY = f'{MACD_KEY}_histogram'
+    
+    __slots__ = ('required_indicators',)
+    
     def __init__(self):
         super().__init__()
         self.required_indicators = ['macd']
@@ -18,15 +32,39 @@ class MACDExpansionStrategy(Strategy):
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
         # Get MACD components
-        macd_key = 'macd_12_26_9'
-        macd_line = indicators.get(f'{macd_key}').iloc[-1] if f'{macd_key}' in indicators else None
-        signal_line = indicators.get(f'{macd_key}_signal').iloc[-1] if f'{macd_key}_signal' in indicators else None
-        histogram = indicators.get(f'{macd_key}_histogram').iloc[-1] if f'{macd_key}_histogram' in indicators else None
-        prev_histogram = indicators.get(f'{macd_key}_histogram').iloc[-2] if f'{macd_key}_histogram' in indicators else None
+        macd_line = last_value(indicators, self.MACD_KEY)
+        signal_line = last_value(indicators, self.SIGNAL_KEY)
+        # one lookup for both histogram values
+        hist_series = indicators.get(self.HISTOGRAM_KEY)
+        histogram = prev_histogram = None
+        if hist_series is not None:
+            histogram = hist_series.iat[-1]
+            prev_histogram = hist_series.iat[-2]
+        elif macd_line is None and signal_line is None:
+            # no MACD supplied by the caller: compute it from closes with the kernel
+            close = np.asarray(column_array(data, 'close'), dtype=np.float64)
+            line, signal, hist = kernels.macd(close, 12, 26, 9)
+            macd_line, signal_line = line[-1], signal[-1]
+            histogram, prev_histogram = hist[-1], hist[-2]
         
-        if not all([macd_line, signal_line, histogram]):
+        if macd_line is None or signal_line is None or histogram is None or isnan(histogram):
             return self.create_signal('HOLD', 0, 'MACD indicators not available')
-        
+        return self._expansion_signal(macd_line, signal_line, histogram, prev_histogram)
+    
+    def set_parameters(self, parameters):
+        """No tunable parameters; values are only recorded in self.parameters."""
+        self.parameters.update(parameters)
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """Same signal as generate_signal at bar i, read from compute_primitives arrays."""
+        i = bar_index(primitives, i)
+        if i + 1 < 30:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        hist = primitives['macd_hist']
+        return self._expansion_signal(primitives['macd'][i], primitives['macd_signal'][i], hist[i], hist[i - 1])
+    
+    def _expansion_signal(self, macd_line, signal_line, histogram, prev_histogram):
+        """Signal from the MACD line, signal line and the last two histogram values."""
         # Bullish: MACD above signal and histogram expanding
         if macd_line > signal_line and histogram > 0:
             if prev_histogram and histogram > prev_histogram:
@@ -1,6 +1,7 @@
 """Market Structure Shift (MSH) strategy."""
 
 from bot.core.interfaces import Strategy
+from bot.strategies._shared_primitives import bar_index
 
 
 class MarketStructureShiftStrategy(Strategy):
@@ -8,14 +9,18 @@ class MarketStructureShiftStrategy(Strategy):
     
     STRATEGY_NAME = "market_structure"
     
+    __slots__ = ('lookback', 'required_indicators', '_min_bars')
+    
     def __init__(self, lookback: int = 10):
         super().__init__()
         self.lookback = lookback
         self.required_indicators = []
+        # two lookback windows: the latest and the one before it
+        self._min_bars = lookback * 2
     
     def generate_signal(self, data, indicators):
         """Generate signal based on market structure changes."""
-        if len(data) < self.lookback * 2:
+        if len(data.index) < self._min_bars:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
         # Find recent highs and lows
@@ -26,7 +31,36 @@ class MarketStructureShiftStrategy(Strategy):
         current_low = recent['low'].min()
         prev_high = prev['high'].max()
         prev_low = prev['low'].min()
-        
+        return self._structure_signal(current_high, current_low, prev_high, prev_low)
+    
+    def set_parameters(self, parameters):
+        """Update the lookback window."""
+        if 'lookback' in parameters:
+            if parameters['lookback'] <= 0:
+                raise ValueError(f"lookback must be positive, got {parameters['lookback']}")
+            self.lookback = parameters['lookback']
+            self.parameters['lookback'] = self.lookback
+            self._min_bars = self.lookback * 2
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """Same signal as generate_signal at bar i, read from compute_primitives arrays."""
+        i = bar_index(primitives, i)
+        lb = self.lookback
+        if i + 1 < self._min_bars:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        roll_max = primitives.get(f'roll_max_{lb}')
+        roll_min = primitives.get(f'roll_min_{lb}')
+        if roll_max is None or roll_min is None:
+            # no precomputed window for this lookback
+            high, low = primitives['high_np'], primitives['low_np']
+            return self._structure_signal(
+                high[i + 1 - lb:i + 1].max(), low[i + 1 - lb:i + 1].min(),
+                high[i + 1 - 2 * lb:i + 1 - lb].max(), low[i + 1 - 2 * lb:i + 1 - lb].min()
+            )
+        return self._structure_signal(roll_max[i], roll_min[i], roll_max[i - lb], roll_min[i - lb])
+    
+    def _structure_signal(self, current_high, current_low, prev_high, prev_low):
+        """Signal from the latest window's high/low against the window before it."""
         # Bullish structure shift: Higher High and Higher Low
         if current_high > prev_high and current_low > prev_low:
             return self.create_signal('BUY', 70, 
@@ -96,24 +96,32 @@ class MeanReversionStrategy(Strategy):
             )
         
         # Calculate mean and standard deviation
-        close_prices = data['close']
+        closes = data['close'].to_numpy(dtype=np.float64)
+        n = len(closes)
         
         if self.use_ema:
+            close_prices = data['close']
             mean = close_prices.ewm(span=self.period, adjust=False).mean()
             std = close_prices.ewm(span=self.period, adjust=False).std()
+            latest_mean = mean.iat[-1]
+            latest_std = std.iat[-1]
+            prev_mean = mean.iat[-2] if n > 1 else latest_mean
+            prev_std = std.iat[-2] if n > 1 else latest_std
         else:
-            mean = close_prices.rolling(window=self.period).mean()
-            std = close_prices.rolling(window=self.period).std()
-        
-        # Get latest values
-        latest_price = close_prices.iloc[-1]
-        latest_mean = mean.iloc[-1]
-        latest_std = std.iloc[-1]
+            # only the latest two windows are used: reduce those slices
+            # instead of rolling mean/std over the whole series
+            latest_mean, latest_std = self._window_stats(closes[-self.period:])
+            if n > self.period:
+                prev_mean, prev_std = self._window_stats(closes[-self.period - 1:-1])
+            elif n > 1:
+                # previous bar had fewer than period closes (rolling gives NaN)
+                prev_mean = prev_std = np.nan
+            else:
+                prev_mean, prev_std = latest_mean, latest_std
         
-        # Get previous values for exit detection
-        prev_price = close_prices.iloc[-2] if len(data) > 1 else latest_price
-        prev_mean = mean.iloc[-2] if len(data) > 1 else latest_mean
-        prev_std = std.iloc[-2] if len(data) > 1 else latest_std
+        # Get latest and previous prices (previous for exit detection)
+        latest_price = closes[-1]
+        prev_price = closes[-2] if n > 1 else latest_price
         
         # Calculate z-scores
         latest_zscore = (latest_price - latest_mean) / latest_std if latest_std > 0 else 0
@@ -219,6 +227,13 @@ class MeanReversionStrategy(Strategy):
                 }
             )
     
+    @staticmethod
+    def _window_stats(window: np.ndarray):
+        """Mean and sample std (ddof=1) of a window, as rolling(window).mean()/.std() give for its last bar."""
+        if len(window) < 2:
+            return window.mean(), np.nan
+        return window.mean(), window.std(ddof=1)
+    
     def _create_buy_signal(self, reason: str, confidence: float, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Create a BUY signal."""
         return {
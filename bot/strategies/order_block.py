@@ -1,6 +1,8 @@
 """Order Block Reaction strategy."""
 
 from bot.core.interfaces import Strategy
+from bot.strategies._arrays import column_array
+from bot.strategies._shared_primitives import bar_index
 
 
 class OrderBlockStrategy(Strategy):
@@ -8,6 +10,8 @@ class OrderBlockStrategy(Strategy):
     
     STRATEGY_NAME = "order_block"
     
+    __slots__ = ('required_indicators',)
+    
     def __init__(self):
         super().__init__()
         self.required_indicators = []
@@ -20,18 +24,40 @@ class OrderBlockStrategy(Strategy):
         if len(data) < 20:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        close = data['close'].iloc[-1]
+        # last 10 candles
+        return self._block_signal(*(
+            column_array(data, col)[-10:]
+            for col in ('open', 'high', 'low', 'close')
+        ))
+    
+    def set_parameters(self, parameters):
+        """No tunable parameters; values are only recorded in self.parameters."""
+        self.parameters.update(parameters)
+    
+    def generate_signal_from_primitives(self, primitives, i=-1):
+        """Same signal as generate_signal at bar i, read from compute_primitives arrays."""
+        i = bar_index(primitives, i)
+        if i + 1 < 20:
+            return self.create_signal('HOLD', 0, 'Insufficient data')
+        window = slice(i - 9, i + 1)
+        return self._block_signal(
+            primitives['open_np'][window], primitives['high_np'][window],
+            primitives['low_np'][window], primitives['close_np'][window]
+        )
+    
+    def _block_signal(self, opens, highs, lows, closes):
+        """Signal for the last close against order blocks among the given candles."""
+        close = closes[-1]
         
         # Find strong bearish candle (potential order block)
-        recent = data.tail(10)
-        for i, (_, row) in enumerate(recent.iterrows()):
-            body = abs(row['close'] - row['open'])
-            range_ = row['high'] - row['low']
+        for o, h, l, c in zip(opens, highs, lows, closes):
+            body = abs(c - o)
+            range_ = h - l
             
             # Large bearish candle
-            if body > range_ * 0.6 and row['close'] < row['open']:
+            if body > range_ * 0.6 and c < o:
                 # If price returns to this area, look for reaction
-                if abs(close - row['close']) / close < 0.005:
+                if abs(close - c) / close < 0.005:
                     return self.create_signal('BUY', 60, 
                         'Price at bearish order block, bounce possible')
         
@@ -19,7 +19,7 @@ class RSIMomentumStrategy(Strategy):
         if len(data) < 15:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        rsi = indicators.get('rsi').iloc[-1] if 'rsi' in indicators else None
+        rsi = indicators.get('rsi').iat[-1] if 'rsi' in indicators else None
         if rsi is None:
             return self.create_signal('HOLD', 0, 'RSI not available')
         
@@ -105,15 +105,15 @@ class ScalpingStrategy(Strategy):
         momentum = close_prices.diff(self.momentum_period)
         
         # Get latest values
-        latest_close = close_prices.iloc[-1]
-        latest_high = high_prices.iloc[-1]
-        latest_low = low_prices.iloc[-1]
-        latest_fast_ma = fast_ma.iloc[-1]
-        latest_momentum = momentum.iloc[-1]
+        latest_close = close_prices.iat[-1]
+        latest_high = high_prices.iat[-1]
+        latest_low = low_prices.iat[-1]
+        latest_fast_ma = fast_ma.iat[-1]
+        latest_momentum = momentum.iat[-1]
         
         # Get previous values for momentum change detection
-        prev_momentum = momentum.iloc[-2] if len(data) > 1 else latest_momentum
-        prev_close = close_prices.iloc[-2] if len(data) > 1 else latest_close
+        prev_momentum = momentum.iat[-2] if len(data) > 1 else latest_momentum
+        prev_close = close_prices.iat[-2] if len(data) > 1 else latest_close
         
         # Calculate momentum acceleration
         momentum_acceleration = latest_momentum - prev_momentum
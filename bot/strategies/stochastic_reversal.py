@@ -17,10 +17,10 @@ class StochasticReversalStrategy(Strategy):
         if len(data) < 15:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        stoch_k = indicators.get('stoch_k').iloc[-1] if 'stoch_k' in indicators else None
-        stoch_d = indicators.get('stoch_d').iloc[-1] if 'stoch_d' in indicators else None
-        prev_k = indicators.get('stoch_k').iloc[-2] if 'stoch_k' in indicators else None
-        prev_d = indicators.get('stoch_d').iloc[-2] if 'stoch_d' in indicators else None
+        stoch_k = indicators.get('stoch_k').iat[-1] if 'stoch_k' in indicators else None
+        stoch_d = indicators.get('stoch_d').iat[-1] if 'stoch_d' in indicators else None
+        prev_k = indicators.get('stoch_k').iat[-2] if 'stoch_k' in indicators else None
+        prev_d = indicators.get('stoch_d').iat[-2] if 'stoch_d' in indicators else None
         
         if not all([stoch_k, stoch_d, prev_k, prev_d]):
             return self.create_signal('HOLD', 0, 'Stochastic indicators not available')
@@ -167,14 +167,14 @@ class StrategyManager:
         # Volume confirmation modifier
         if 'volume' in data.columns:
             avg_volume = data['volume'].tail(20).mean()
-            current_volume = data['volume'].iloc[-1]
+            current_volume = data['volume'].iat[-1]
             if current_volume > avg_volume * 1.2:
                 modifiers['volume_confirmation'] = 5.0
                 modifier_value += 5.0
         
         # ADX strength modifier
         if 'adx' in indicators:
-            adx_value = indicators['adx'].iloc[-1]
+            adx_value = indicators['adx'].iat[-1]
             if adx_value > 25:
                 modifiers['adx_strength'] = 5.0
                 modifier_value += 5.0
@@ -184,7 +184,7 @@ class StrategyManager:
         
         # RSI overbought/oversold check for contrarian signals
         if 'rsi' in indicators:
-            rsi_value = indicators['rsi'].iloc[-1]
+            rsi_value = indicators['rsi'].iat[-1]
             if signal_type == 'BUY' and rsi_value < 30:
                 modifiers['rsi_oversold'] = 10.0
                 modifier_value += 10.0
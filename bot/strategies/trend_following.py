@@ -115,14 +115,14 @@ class TrendFollowingStrategy(Strategy):
             data[slow_ma_col] = close_prices.rolling(window=self.slow_period).mean()
         
         # Get latest values
-        latest_close = close_prices.iloc[-1]
-        latest_fast_ma = data[fast_ma_col].iloc[-1]
-        latest_slow_ma = data[slow_ma_col].iloc[-1]
+        latest_close = close_prices.iat[-1]
+        latest_fast_ma = data[fast_ma_col].iat[-1]
+        latest_slow_ma = data[slow_ma_col].iat[-1]
         
         # Get previous values for crossover detection
-        prev_close = close_prices.iloc[-2] if len(data) > 1 else latest_close
-        prev_fast_ma = data[fast_ma_col].iloc[-2] if len(data) > 1 else latest_fast_ma
-        prev_slow_ma = data[slow_ma_col].iloc[-2] if len(data) > 1 else latest_slow_ma
+        prev_close = close_prices.iat[-2] if len(data) > 1 else latest_close
+        prev_fast_ma = data[fast_ma_col].iat[-2] if len(data) > 1 else latest_fast_ma
+        prev_slow_ma = data[slow_ma_col].iat[-2] if len(data) > 1 else latest_slow_ma
         
         # Generate signal based on signal type
         if self.signal_type == 'price_ma':
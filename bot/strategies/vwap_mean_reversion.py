@@ -18,11 +18,11 @@ class VWAPMeanReversionStrategy(Strategy):
         if len(data) < 20:
             return self.create_signal('HOLD', 0, 'Insufficient data')
         
-        vwap = indicators.get('vwap').iloc[-1] if 'vwap' in indicators else None
+        vwap = indicators.get('vwap').iat[-1] if 'vwap' in indicators else None
         if vwap is None:
             return self.create_signal('HOLD', 0, 'VWAP not available')
         
-        close = data['close'].iloc[-1]
+        close = data['close'].iat[-1]
         
         # Calculate deviation from VWAP
         deviation = (close - vwap) / vwap
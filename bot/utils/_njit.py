@@ -0,0 +1,25 @@
+"""
+Optional numba JIT decorator.
+Falls back to a no-op decorator when numba is not installed, so kernels
+written against it still run (as plain Python/NumPy) everywhere; prange
+falls back to range.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit; supports both @njit and @njit(...)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -0,0 +1,186 @@
+"""
+Indicator kernels operating on raw float arrays.
+JIT-compiled with numba when available (see bot.utils._njit); results match
+the pandas formulations they replace in SignalBot's internal indicators.
+Outputs take the dtype of the input (float64, or float32 when SignalBot is
+configured with use_float32_indicators); accumulation is done in float64.
+"""
+
+import numpy as np
+
+from bot.utils._njit import njit
+
+
+# no fastmath in this module: it would let numba drop the NaN checks below
+@njit(cache=True)
+def ewma_continue(values: np.ndarray, alpha: float, prev: float) -> np.ndarray:
+    """
+    ewma over values, continuing from a previous output `prev` (NaN: seed
+    with the first non-NaN value). NaNs carry the previous value and, as in
+    pandas ewm(adjust=False, ignore_na=False), decay its weight until the
+    next observation.
+    """
+    n = values.shape[0]
+    out = np.empty_like(values)
+    decay = 1.0 - alpha
+    old_wt = 1.0
+    for i in range(n):
+        x = values[i]
+        if prev == prev:
+            old_wt *= decay
+            if x == x:
+                if old_wt == decay:
+                    prev = alpha * x + decay * prev
+                else:
+                    # after a gap the previous value's weight has decayed further
+                    prev = (old_wt * prev + alpha * x) / (old_wt + alpha)
+                old_wt = 1.0
+        elif x == x:
+            prev = x
+        out[i] = prev
+    return out
+
+
+@njit(cache=True)
+def ewma(values: np.ndarray, alpha: float) -> np.ndarray:
+    """y[i] = alpha * x[i] + (1 - alpha) * y[i-1], seeded with the first non-NaN x; NaNs as in ewma_continue."""
+    n = values.shape[0]
+    out = np.empty_like(values)
+    if n == 0:
+        return out
+    prev = float(values[0])
+    out[0] = prev
+    decay = 1.0 - alpha
+    old_wt = 1.0
+    for i in range(1, n):
+        x = values[i]
+        if prev == prev:
+            old_wt *= decay
+            if x == x:
+                if old_wt == decay:
+                    prev = alpha * x + decay * prev
+                else:
+                    prev = (old_wt * prev + alpha * x) / (old_wt + alpha)
+                old_wt = 1.0
+        elif x == x:
+            prev = x
+        out[i] = prev
+    return out
+
+
+@njit(cache=True)
+def ema(close: np.ndarray, period: int) -> np.ndarray:
+    """EMA with alpha = 2 / (period + 1) (pandas ewm(span=period, adjust=False))."""
+    return ewma(close, 2.0 / (period + 1.0))
+
+
+@njit(cache=True)
+def macd(close: np.ndarray, fast: int, slow: int, signal: int):
+    """(MACD line, signal line, histogram) as the pandas MACD indicator computes them (ewm(adjust=False))."""
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+@njit(cache=True)
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean over `window` samples, averaging the non-NaN values
+    available (min_periods=1); NaN while the window holds none.
+    """
+    n = values.shape[0]
+    out = np.empty_like(values)
+    total = 0.0
+    valid = 0
+    for i in range(n):
+        x = values[i]
+        if x == x:
+            total += x
+            valid += 1
+        if i >= window:
+            y = values[i - window]
+            if y == y:
+                total -= y
+                valid -= 1
+        if valid:
+            out[i] = total / valid
+        else:
+            total = 0.0
+            out[i] = np.nan
+    return out
+
+
+@njit(cache=True)
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """
+    max(high - low, |high - prev close|, |low - prev close|) over the terms
+    that are not NaN (NaN if none is); the first bar is high - low.
+    """
+    n = high.shape[0]
+    out = np.empty_like(high)
+    if n == 0:
+        return out
+    out[0] = high[0] - low[0]
+    for i in range(1, n):
+        pc = close[i - 1]
+        hl = high[i] - low[i]
+        hc = abs(high[i] - pc)
+        lc = abs(low[i] - pc)
+        tr = hl
+        if hc > tr or tr != tr:
+            tr = hc
+        if lc > tr or tr != tr:
+            tr = lc
+        out[i] = tr
+    return out
+
+
+@njit(cache=True)
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Average true range as a simple rolling mean of true range (min_periods=1).
+    True range and the running window sum are computed in the same loop;
+    NaN true ranges are left out of the mean as in rolling_mean.
+    """
+    n = high.shape[0]
+    tr = np.empty(n, dtype=np.float64)
+    out = np.empty_like(high)
+    total = 0.0
+    valid = 0
+    for i in range(n):
+        t = high[i] - low[i]
+        if i > 0:
+            pc = close[i - 1]
+            hc = abs(high[i] - pc)
+            lc = abs(low[i] - pc)
+            if hc > t or t != t:
+                t = hc
+            if lc > t or t != t:
+                t = lc
+        tr[i] = t
+        if t == t:
+            total += t
+            valid += 1
+        if i >= period:
+            y = tr[i - period]
+            if y == y:
+                total -= y
+                valid -= 1
+        if valid:
+            out[i] = total / valid
+        else:
+            total = 0.0
+            out[i] = np.nan
+    return out
+
+
+def warmup(dtype=np.float64) -> None:
+    """Call each kernel once on a tiny array so JIT compilation (or cache load) happens at startup."""
+    x = np.linspace(1.0, 2.0, 8).astype(dtype)
+    ema(x, 3)
+    macd(x, 2, 3, 2)
+    ewma_continue(x, 0.5, 1.0)
+    atr(x + 0.5, x - 0.5, x, 3)
+
+
+__all__ = ['ewma', 'ewma_continue', 'ema', 'macd', 'rolling_mean', 'true_range', 'atr', 'warmup']
@@ -0,0 +1,42 @@
+"""
+JSON serialization helpers.
+Uses orjson when installed (native numpy support, emits bytes) and falls back
+to the standard library otherwise. Datetimes and dataclasses go through
+default=str on both paths, so stored JSON keeps the 'YYYY-MM-DD HH:MM:SS'
+format of rows written with json.dumps(default=str).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTS = (
+        orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except Exception:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTS)
+    return json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Serialize obj to a compact JSON string (e.g. for TEXT columns and log lines)."""
+    return dumps(obj).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ['dumps', 'dumps_str', 'loads', 'ORJSON_AVAILABLE']
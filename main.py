@@ -18,6 +18,13 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config import get_config, validate_config
 from bot.utils.logger import setup_logger
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except Exception:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
 def load_metadata() -> dict:
     metadata_path = Path(__file__).parent / "metadata.json"
     try:
@@ -26,7 +33,16 @@ def load_metadata() -> dict:
     except Exception:
         return {"name": "APEX SIGNAL™", "version": "3.0.0", "build_date": datetime.utcnow().isoformat(), "git_commit": "unknown"}
 
-logger = None
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the main event loop (uvloop when installed). The default task
+    factory is kept: SignalBot._spawn starts its own tasks eagerly, and
+    other libraries on the loop (uvicorn, aiohttp) keep normal scheduling.
+    """
+    return uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+
+# configured by setup_logger() in validate_startup(); same object, so safe to bind early
+logger = logging.getLogger("APEX_SIGNAL")
 
 class Application:
     def __init__(self):
@@ -56,8 +72,7 @@ class Application:
         print(banner)
 
     def validate_startup(self) -> bool:
-        global logger
-        logger = setup_logger("APEX_SIGNAL", self.config.log_level)
+        setup_logger("APEX_SIGNAL", self.config.log_level)
         self.print_startup_banner()
         logger.info("🚀 Starting APEX SIGNAL™ application...")
         is_valid, validation = validate_config()
@@ -74,49 +89,78 @@ class Application:
         logger.info("✅ Configuration validation passed")
         return True
 
-    async def start(self):
-        global logger
-        if not self.is_running:
-            try:
-                self.start_time = datetime.utcnow()
-                logger.info("🤖 Initializing signal bot...")
-                from bot.signal_bot import SignalBot
-                from bot.api.app import create_app
-
-                signal_bot = SignalBot()
-
-                # initialize the bot BEFORE starting server so health endpoint can report actual state
-                init_ok = await signal_bot.initialize()
-                if not init_ok:
-                    logger.warning("⚠️ SignalBot initialization reported failure. API will still start in degraded mode.")
-
-                # create app with bot reference
-                logger.info("🌐 Creating FastAPI application...")
-                api_app = create_app(signal_bot=signal_bot)
-
-                import uvicorn
-                config = uvicorn.Config(
-                    app=api_app,
-                    host="0.0.0.0",
-                    port=self.config.port,
-                    loop="asyncio",
-                    workers=1,
-                    log_level=self.config.log_level.lower()
-                )
-                server = uvicorn.Server(config)
-                self.api_server = server
-                self.is_running = True
-                logger.info(f"✅ Application started successfully on port {self.config.port}")
-                logger.info(f"   Health check: http://0.0.0.0:{self.config.port}/healthz")
-                logger.info(f"   API docs: http://0.0.0.0:{self.config.port}/docs")
-                await server.serve()
-            except Exception as e:
-                logger.exception("❌ Failed to start application: %s", e)
-                self.is_running = False
-                raise
+    async def start(self) -> int:
+        """Run the bot + API until the server exits. Returns a process exit code."""
+        if self.is_running:
+            return 0
+        signal_bot = None
+        try:
+            self.start_time = datetime.utcnow()
+            logger.info("🤖 Initializing signal bot...")
+            from bot.signal_bot import SignalBot
+            from bot.api.app import create_app
+
+            signal_bot = SignalBot()
+
+            # initialize the bot BEFORE starting server so health endpoint can report actual state
+            init_ok = await signal_bot.initialize()
+            if not init_ok:
+                logger.warning("⚠️ SignalBot initialization reported failure. API will still start in degraded mode.")
+
+            # create app with bot reference
+            logger.info("🌐 Creating FastAPI application...")
+            api_app = create_app(signal_bot=signal_bot)
+
+            import uvicorn
+            config = uvicorn.Config(
+                app=api_app,
+                host="0.0.0.0",
+                port=self.config.port,
+                loop="asyncio",
+                workers=1,
+                log_level=self.config.log_level.lower()
+            )
+            server = uvicorn.Server(config)
+            # we own SIGINT/SIGTERM so the bot gets to flush before the loop closes
+            server.install_signal_handlers = lambda: None
+            self.api_server = server
+            self.is_running = True
+            logger.info(f"✅ Application started successfully on port {self.config.port}")
+            logger.info(f"   Health check: http://0.0.0.0:{self.config.port}/healthz")
+            logger.info(f"   API docs: http://0.0.0.0:{self.config.port}/docs")
+            loop = asyncio.get_running_loop()
+            stop = loop.create_future()
+
+            def _on_signal(signum: int) -> None:
+                logger.info("📡 Received signal %s, shutting down...", signum)
+                if not stop.done():
+                    stop.set_result(signum)
+
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, _on_signal, sig)
+                except (NotImplementedError, RuntimeError):
+                    pass  # e.g. Windows; fall back to KeyboardInterrupt
+
+            serve_task = asyncio.create_task(server.serve())
+            await asyncio.wait([serve_task, stop], return_when=asyncio.FIRST_COMPLETED)
+            if not serve_task.done():
+                server.should_exit = True
+                await serve_task
+            return 0
+        except Exception as e:
+            logger.exception("❌ Failed to start application: %s", e)
+            return 1
+        finally:
+            # flush pending notifications while the loop is still alive
+            if signal_bot is not None and signal_bot.is_running:
+                try:
+                    await signal_bot.shutdown()
+                except Exception:
+                    logger.exception("Error while shutting down the bot")
+            await self.stop()
 
     async def stop(self):
-        global logger
         if self.is_running:
             logger.info("🛑 Stopping application...")
             for task in self.tasks:
@@ -129,29 +173,20 @@ class Application:
             self.is_running = False
             logger.info("✅ Application stopped gracefully")
 
-    def run(self):
-        global logger
+    def run(self) -> int:
         # validate (logs errors/warnings)
         self.validate_startup()
 
-        # setup signals
-        def _handle(signum, frame):
-            if logger:
-                logger.info("📡 Received signal %s, shutting down...", signum)
-            self.is_running = False
-
-        signal.signal(signal.SIGINT, _handle)
-        signal.signal(signal.SIGTERM, _handle)
-
+        # SIGINT/SIGTERM are handled on the event loop in start()
         try:
-            asyncio.run(self.start())
+            with asyncio.Runner(loop_factory=new_event_loop) as runner:
+                return runner.run(self.start())
         except KeyboardInterrupt:
-            if logger:
-                logger.info("👋 Interrupted by user")
+            logger.info("👋 Interrupted by user")
+            return 0
         except Exception:
-            if logger:
-                logger.exception("❌ Application crashed")
-            sys.exit(1)
+            logger.exception("❌ Application crashed")
+            return 1
 
 
 def health_check() -> int:
@@ -170,4 +205,4 @@ if __name__ == "__main__":
         sys.exit(health_check())
     else:
         app = Application()
-        app.run()
+        sys.exit(app.run())
@@ -110,6 +110,20 @@ class TestPersistence(unittest.TestCase):
         self.assertEqual(retrieved.symbol, "ETHUSDT")
         self.assertEqual(retrieved.signal_type, "SELL")
     
+    def test_json_columns_keep_datetime_format(self):
+        """Test datetimes serialize as json.dumps(default=str) wrote them to existing rows."""
+        import json
+        from datetime import date, timezone
+        from bot.utils.serialization import dumps_str
+        
+        payload = {
+            'naive': datetime(2024, 1, 2, 3, 4, 5),
+            'aware': datetime(2024, 1, 2, 3, 4, 5, 600, tzinfo=timezone.utc),
+            'day': date(2024, 1, 2),
+        }
+        expected = json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+        self.assertEqual(dumps_str(payload), expected)
+    
     def test_checksum_verification(self):
         """Test signal checksum verification."""
         import hashlib
@@ -201,6 +215,115 @@ class TestIndicators(unittest.TestCase):
         self.assertIn('bb_upper_20', result.columns)
         self.assertIn('bb_lower_20', result.columns)
     
+    def test_kernels_match_pandas(self):
+        """Test array kernels match the pandas EMA/ATR formulations."""
+        from bot.utils import kernels
+
+        close = self.data['close'].to_numpy(dtype=np.float64)
+        high = self.data['high'].to_numpy(dtype=np.float64)
+        low = self.data['low'].to_numpy(dtype=np.float64)
+
+        expected_ema = self.data['close'].ewm(span=20, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(kernels.ema(close, 20), expected_ema)
+
+        tr = pd.concat([
+            self.data['high'] - self.data['low'],
+            (self.data['high'] - self.data['close'].shift()).abs(),
+            (self.data['low'] - self.data['close'].shift()).abs(),
+        ], axis=1).max(axis=1)
+        expected_atr = tr.rolling(window=14, min_periods=1).mean().to_numpy()
+        np.testing.assert_allclose(kernels.atr(high, low, close, 14), expected_atr)
+
+    def test_kernels_match_pandas_with_gaps(self):
+        """Test kernels recover from NaN bars the way the pandas formulations do."""
+        from bot.utils import kernels
+
+        data = self.data.astype({'volume': np.float64})
+        data.loc[0, 'close'] = np.nan
+        data.loc[[10, 40, 41], ['high', 'low', 'close']] = np.nan
+        data.loc[60:79, 'volume'] = np.nan
+        close = data['close'].to_numpy(dtype=np.float64)
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        volume = data['volume'].to_numpy(dtype=np.float64)
+
+        expected_ema = data['close'].ewm(span=20, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(kernels.ema(close, 20), expected_ema)
+
+        expected_vol = data['volume'].rolling(window=20, min_periods=1).mean().to_numpy()
+        np.testing.assert_allclose(kernels.rolling_mean(volume, 20), expected_vol)
+
+        tr = pd.concat([
+            data['high'] - data['low'],
+            (data['high'] - data['close'].shift()).abs(),
+            (data['low'] - data['close'].shift()).abs(),
+        ], axis=1).max(axis=1)
+        expected_atr = tr.rolling(window=14, min_periods=1).mean().to_numpy()
+        result = kernels.atr(high, low, close, 14)
+        np.testing.assert_allclose(result, expected_atr)
+        self.assertFalse(np.isnan(result[-1]))
+
+    def test_kernels_float32(self):
+        """Test kernels keep float32 inputs in float32 and stay close to float64 results."""
+        from bot.utils import kernels
+
+        close = self.data['close'].to_numpy(dtype=np.float64)
+        high = self.data['high'].to_numpy(dtype=np.float64)
+        low = self.data['low'].to_numpy(dtype=np.float64)
+        c32, h32, l32 = (a.astype(np.float32) for a in (close, high, low))
+
+        ema32 = kernels.ema(c32, 20)
+        atr32 = kernels.atr(h32, l32, c32, 14)
+        self.assertEqual(ema32.dtype, np.float32)
+        self.assertEqual(atr32.dtype, np.float32)
+        np.testing.assert_allclose(ema32, kernels.ema(close, 20), rtol=1e-5)
+        np.testing.assert_allclose(atr32, kernels.atr(high, low, close, 14), rtol=1e-4)
+
+    def test_incremental_ema_carries_state(self):
+        """Test SignalBot.update_ema continues the previous scan's EMA over a sliding window."""
+        from bot.signal_bot import SignalBot
+        from bot.utils import kernels
+
+        bot = SignalBot()
+        close = self.data['close'].to_numpy(dtype=np.float64)
+        ts = pd.DatetimeIndex(self.data['timestamp']).asi8
+        alpha = 2.0 / 21.0
+
+        bot.update_ema('BTC/USD', 'ema_20', close[:80], ts[:80], alpha)
+        result = bot.update_ema('BTC/USD', 'ema_20', close[5:85], ts[5:85], alpha)
+
+        np.testing.assert_allclose(result, kernels.ewma(close[:85], alpha)[5:])
+
+    def test_ewma_state_survives_restart(self):
+        """Test EMA state saved on shutdown is restored by the next bot, and stale state is dropped."""
+        import tempfile
+        from pathlib import Path
+        from bot.signal_bot import SignalBot
+
+        close = self.data['close'].to_numpy(dtype=np.float64)
+        ts = pd.DatetimeIndex(self.data['timestamp']).asi8
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'ewma_state.json'
+            bot = SignalBot()
+            bot._ewma_state_path = path
+            bot.update_ema('BTC/USD', 'ema_20', close, ts, 2.0 / 21.0)
+            bot._save_ewma_state()
+
+            restored = SignalBot()
+            restored._ewma_state_path = path
+            restored._ewma_state_max_age = 10 ** 10
+            restored._load_ewma_state()
+            old_ts, old_vals = bot._ewma_state[('BTC/USD', 'ema_20')]
+            new_ts, new_vals = restored._ewma_state[('BTC/USD', 'ema_20')]
+            np.testing.assert_array_equal(new_ts, old_ts)
+            np.testing.assert_allclose(new_vals, old_vals)
+
+            stale = SignalBot()
+            stale._ewma_state_path = path
+            stale._ewma_state_max_age = 0
+            stale._load_ewma_state()
+            self.assertEqual(stale._ewma_state, {})
+
     def test_all_indicators_exist(self):
         """Test all 22 indicators can be imported."""
         indicator_names = [
@@ -280,6 +403,122 @@ class TestStrategies(unittest.TestCase):
         self.assertIn('signal', signal) 
         self.assertIn('reason', signal)
         self.assertIn(signal['signal'], ['BUY', 'SELL', 'HOLD'])
+    
+    def test_shared_primitives_rolling_extremes(self):
+        """Deque rolling max/min match the pandas rolling reductions."""
+        from bot.strategies._shared_primitives import compute_primitives
+        
+        p = compute_primitives(self.data)
+        np.testing.assert_allclose(p['roll_max_20'], self.data['high'].rolling(20).max().to_numpy())
+        np.testing.assert_allclose(p['roll_min_10'], self.data['low'].rolling(10).min().to_numpy())
+        np.testing.assert_allclose(p['vol_mean_20'], self.data['volume'].rolling(20).mean().to_numpy())
+    
+    def test_primitives_match_per_bar_signals(self):
+        """generate_signal_from_primitives at bar i matches generate_signal on the first i + 1 bars."""
+        from bot.strategies._shared_primitives import compute_primitives, evaluate_all
+        from bot.strategies.ema_trend_stack import EMATrendStackStrategy
+        from bot.strategies.macd_expansion import MACDExpansionStrategy
+        from bot.strategies.ichimoku_bias import IchimokuBiasStrategy
+        from bot.strategies.market_structure import MarketStructureShiftStrategy
+        from bot.strategies.fibonacci_confluence import FibonacciConfluenceStrategy
+        from bot.strategies.order_block import OrderBlockStrategy
+        
+        high, low = self.data['high'], self.data['low']
+        tenkan = (high.rolling(9).max() + low.rolling(9).min()) / 2
+        kijun = (high.rolling(26).max() + low.rolling(26).min()) / 2
+        ichimoku = {
+            'ichimoku_tenkan': tenkan,
+            'ichimoku_kijun': kijun,
+            'ichimoku_senkou_a': ((tenkan + kijun) / 2).shift(26),
+            'ichimoku_senkou_b': ((high.rolling(52).max() + low.rolling(52).min()) / 2).shift(26),
+        }
+        strategies = [
+            EMATrendStackStrategy(), MACDExpansionStrategy(), IchimokuBiasStrategy(),
+            MarketStructureShiftStrategy(), FibonacciConfluenceStrategy(), OrderBlockStrategy(),
+        ]
+        primitives = compute_primitives(self.data, ichimoku)
+        
+        for strategy in strategies:
+            with self.subTest(strategy=strategy.name):
+                for i in range(len(self.data)):
+                    expected = strategy.generate_signal(
+                        self.data.iloc[:i + 1], {key: s.iloc[:i + 1] for key, s in ichimoku.items()}
+                    )
+                    signal = strategy.generate_signal_from_primitives(primitives, i)
+                    self.assertEqual(signal['signal'], expected['signal'], f"bar {i}")
+                    self.assertEqual(signal['reason'], expected['reason'], f"bar {i}")
+                    self.assertAlmostEqual(signal['confidence'], expected['confidence'], msg=f"bar {i}")
+        
+        latest = evaluate_all(self.data, strategies, indicators=ichimoku)
+        self.assertEqual(latest, [s.generate_signal_from_primitives(primitives, -1) for s in strategies])
+    
+    def test_reused_indicators_dict_is_not_stale(self):
+        """Strategies evaluated over prefixes with one indicators dict neither cache into it nor read stale bars."""
+        from bot.strategies.fibonacci_confluence import FibonacciConfluenceStrategy
+        
+        strategy = FibonacciConfluenceStrategy()
+        shared = {}
+        for i in range(50, len(self.data)):
+            window = self.data.iloc[:i + 1]
+            self.assertEqual(strategy.generate_signal(window, shared), strategy.generate_signal(window, {}))
+        self.assertEqual(shared, {})
+    
+    def test_gap_and_sweep_batch_match_per_bar(self):
+        """FVG and liquidity sweep generate_signals codes match generate_signal on each prefix."""
+        from bot.strategies.fvg_fill import FVGFillStrategy
+        from bot.strategies.liquidity_sweep import LiquiditySweepStrategy
+        
+        # bars of one random walk, so gaps and sweeps of real bar structure occur
+        n = 1000
+        rng = np.random.default_rng(7)
+        close = 100 + np.cumsum(rng.normal(0, 1, n))
+        open_ = np.concatenate([[100.0], close[:-1]]) + rng.normal(0, 0.5, n)
+        data = pd.DataFrame({
+            'open': open_,
+            'high': np.maximum(open_, close) + rng.exponential(0.3, n),
+            'low': np.minimum(open_, close) - rng.exponential(0.3, n),
+            'close': close,
+            'volume': rng.integers(100, 1000, n),
+        })
+        codes = {'HOLD': 0, 'BUY': 1, 'SELL': 2}
+        for strategy in (FVGFillStrategy(), LiquiditySweepStrategy()):
+            with self.subTest(strategy=strategy.name):
+                batch = strategy.generate_signals(data)
+                per_bar = [
+                    codes[strategy.generate_signal(data.iloc[:i + 1], {})['signal']]
+                    for i in range(len(data))
+                ]
+                self.assertTrue((batch != 0).any())
+                np.testing.assert_array_equal(batch, per_bar)
+    
+    def test_breakout_batch_matches_per_bar(self):
+        """BreakoutStrategy.generate_signals row i matches generate_signal on the first i + 1 bars."""
+        from bot.strategies.breakout import BreakoutStrategy
+        
+        strategy = BreakoutStrategy(parameters={'period': 10, 'threshold': 0.002})
+        batch = strategy.generate_signals(self.data)
+        self.assertTrue((batch['code'] != 0).any())
+        for i in range(len(self.data)):
+            signal = strategy.generate_signal(self.data.iloc[:i + 1])
+            self.assertEqual(batch['signal'].iat[i], signal['signal'], f"bar {i}")
+            self.assertAlmostEqual(batch['confidence'].iat[i], signal['confidence'], msg=f"bar {i}")
+    
+    def test_arbitrage_batch_matches_per_bar(self):
+        """ArbitrageStrategy.generate_signals element i matches generate_signal on the first i + 1 bars."""
+        from bot.strategies.arbitrage import ArbitrageStrategy
+        
+        codes = {'HOLD': 0, 'BUY': 1, 'SELL': 2}
+        for method in ('moving_average', 'vwap', 'theoretical'):
+            with self.subTest(method=method):
+                strategy = ArbitrageStrategy(parameters={
+                    'fair_value_method': method, 'fair_value_period': 10, 'deviation_threshold': 0.005,
+                })
+                batch = strategy.generate_signals(self.data)
+                per_bar = [
+                    codes[strategy.generate_signal(self.data.iloc[:i + 1])['signal']]
+                    for i in range(len(self.data))
+                ]
+                np.testing.assert_array_equal(batch, per_bar)
 
 
 class TestConnectors(unittest.TestCase):
@@ -308,6 +547,17 @@ class TestConnectors(unittest.TestCase):
         self.assertIsNotNone(price)
         self.assertIsInstance(price, float)
         self.assertGreater(price, 0)
+    
+    def test_bars_batch_only_when_overridden(self):
+        """Only connectors overriding fetch_bars_batch report a real batch endpoint."""
+        from bot.connectors.mock_live import MockLiveConnector
+        
+        class BatchConnector(MockLiveConnector):
+            def fetch_bars_batch(self, symbols, timeframe, limit=None):
+                return {}
+        
+        self.assertFalse(MockLiveConnector().has_bars_batch())
+        self.assertTrue(BatchConnector().has_bars_batch())
 
 
 class TestChecksum(unittest.TestCase):
@@ -0,0 +1,195 @@
+"""Tests for SignalBot notification plumbing."""
+
+import asyncio
+import unittest
+from collections import deque
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class TestErrorNotifications(unittest.TestCase):
+    """Test error notification coalescing."""
+
+    def setUp(self):
+        from bot.signal_bot import SignalBot
+        self.bot = SignalBot()
+        self.bot.telegram_notifier = Mock()
+        # stands in for the flush loop started by initialize() for an enabled notifier
+        self.bot._flush_task = Mock()
+
+    def test_identical_errors_are_suppressed(self):
+        """Repeated identical errors inside the window are queued only once."""
+        for _ in range(5):
+            asyncio.run(self.bot._send_error_notification("boom"))
+        self.assertEqual(self.bot._notify_queue.qsize(), 1)
+        self.assertEqual(self.bot._err_suppressed[hash("boom")], 4)
+
+    def test_suppressed_count_reported_after_window(self):
+        """A burst that stops is summarized once its window has expired."""
+        for _ in range(5):
+            asyncio.run(self.bot._send_error_notification("boom"))
+        self.bot._flush_suppressed_errors()
+        self.assertEqual(self.bot._notify_queue.qsize(), 1)
+        self.bot._err_seen[hash("boom")] -= 61.0
+        self.bot._flush_suppressed_errors()
+        self.assertEqual(self.bot._notify_queue.qsize(), 2)
+        self.bot._notify_queue.get_nowait()
+        self.assertEqual(self.bot._notify_queue.get_nowait()[2], "boom (+4 identical suppressed)")
+        self.assertNotIn(hash("boom"), self.bot._err_suppressed)
+
+    def test_distinct_errors_are_sent(self):
+        """Different errors are not coalesced."""
+        asyncio.run(self.bot._send_error_notification("boom"))
+        asyncio.run(self.bot._send_error_notification("bang"))
+        self.assertEqual(self.bot._notify_queue.qsize(), 2)
+
+    def test_nothing_queued_without_flush_loop(self):
+        """A disabled notifier has no consumer, so errors are not queued."""
+        self.bot._flush_task = None
+        asyncio.run(self.bot._send_error_notification("boom"))
+        self.assertEqual(self.bot._notify_queue.qsize(), 0)
+
+    def test_full_queue_drops_oldest(self):
+        """A full queue keeps the newest records."""
+        self.bot._notify_queue = asyncio.Queue(maxsize=2)
+        for text in ("a", "b", "c"):
+            self.bot._enqueue_notification('ERROR', text)
+        self.assertEqual([self.bot._notify_queue.get_nowait()[2] for _ in range(2)], ["b", "c"])
+
+    def test_batch_has_single_header(self):
+        """A batch of records formats to one header and one row per record."""
+        text = self.bot._format_notification_batch([("ERROR", 0.0, "boom"), ("WARNING", 61.0, "slow feed")])
+        self.assertEqual(text.count("ALERTS"), 1)
+        self.assertIn("❌ 00:00:00 boom", text)
+        self.assertIn("⚠️ 00:01:01 slow feed", text)
+
+
+class TestSpawn(unittest.TestCase):
+    """Test background task scheduling."""
+
+    @unittest.skipUnless(hasattr(asyncio, 'eager_task_factory'), "eager tasks need Python 3.12+")
+    def test_only_spawned_tasks_start_eagerly(self):
+        """_spawn runs its coroutine up to the first await; create_task keeps default ordering."""
+        from bot.signal_bot import SignalBot
+        bot = SignalBot()
+        order = []
+
+        async def step(tag):
+            order.append(tag)
+            await asyncio.sleep(0)
+
+        async def main():
+            bot._spawn(step("spawned"))
+            order.append("after spawn")
+            task = asyncio.create_task(step("created"))
+            order.append("after create_task")
+            await task
+            await bot._drain_background_tasks()
+
+        asyncio.run(main())
+        self.assertEqual(order, ["spawned", "after spawn", "after create_task", "created"])
+
+
+class TestDailySummary(unittest.TestCase):
+    """Test the daily signal log."""
+
+    def setUp(self):
+        from bot.signal_bot import SignalBot
+        self.bot = SignalBot()
+
+    def test_daily_stats(self):
+        """Counts and mean confidence cover today's signals."""
+        for i in range(300):
+            self.bot._record_daily_signal({'signal': 'BUY' if i % 3 else 'SELL', 'confidence': 60.0})
+        stats = self.bot._daily_stats()
+        self.assertEqual(stats['total'], 300)
+        self.assertEqual(stats['sell'], 100)
+        self.assertEqual(stats['buy'], 200)
+        self.assertAlmostEqual(stats['avg_confidence'], 60.0)
+
+    def test_daily_log_is_bounded(self):
+        """The signal log keeps only the newest entries; the day's counters keep counting."""
+        self.bot.daily_signals = deque(maxlen=10)
+        for _ in range(25):
+            self.bot._record_daily_signal({'signal': 'BUY', 'confidence': 50.0})
+        self.assertEqual(len(self.bot.daily_signals), 10)
+        self.assertEqual(self.bot._daily_stats()['total'], 25)
+
+    def test_summary_reports_ended_day(self):
+        """The summary covers the day that ended, then drops its counters; today's are kept."""
+        self.bot.telegram_notifier = Mock()
+        sent = []
+
+        async def fake_send(text):
+            sent.append(text)
+
+        self.bot.telegram_notifier._send = fake_send
+        self.bot._daily_counters['2000-01-01'].update(BUY=3, conf_sum=150.0, n=3)
+        self.bot._record_daily_signal({'signal': 'SELL', 'confidence': 70.0})
+        asyncio.run(self.bot._send_daily_summary('2000-01-01'))
+        self.assertEqual(len(sent), 1)
+        self.assertIn("Date: 2000-01-01", sent[0])
+        self.assertIn("Signals: 3 (BUY 3 / SELL 0)", sent[0])
+        self.assertNotIn('2000-01-01', self.bot._daily_counters)
+        self.assertEqual(self.bot._daily_stats()['total'], 1)
+
+
+class TestMessageSplitting(unittest.TestCase):
+    """Test Telegram message length handling."""
+
+    def test_short_message_untouched(self):
+        """Messages under the limit are returned as-is."""
+        from bot.notifiers.telegram_notifier import split_message
+        self.assertEqual(split_message("hello"), ["hello"])
+
+    def test_long_message_split_under_limit(self):
+        """Long messages are split into numbered parts under Telegram's limit."""
+        from bot.notifiers.telegram_notifier import split_message
+        parts = split_message("x" * 9000)
+        self.assertEqual(len(parts), 3)
+        self.assertTrue(all(len(p) <= 4096 for p in parts))
+        self.assertTrue(parts[-1].endswith("(part 3/3)"))
+
+
+class TestFramedSend(unittest.TestCase):
+    """Test pre-encoded header/footer framing for send_framed."""
+
+    def test_framed_body_round_trips(self):
+        """Spliced header/body/footer fragments decode to the concatenated text."""
+        import json
+        from bot.notifiers.telegram_notifier import json_fragment
+        header, body, footer = "⚠️ ALERTS\n━━\n", 'a "quoted" \\ row\n', "━━\n"
+        data = b'{"text":"' + json_fragment(header) + json_fragment(body) + json_fragment(footer) + b'"}'
+        self.assertEqual(json.loads(data)["text"], header + body + footer)
+
+
+class TestRateLimit(unittest.TestCase):
+    """Test client-side Telegram rate limiting."""
+
+    def test_full_window_delays_send(self):
+        """A send with the window already full sleeps until the oldest entry expires."""
+        import tempfile
+        import os
+        from time import monotonic
+        from bot.notifiers.telegram_notifier import TelegramNotifier, RATE_LIMIT_MSGS
+        with tempfile.TemporaryDirectory() as tmp, patch.dict(os.environ, {"APEX_TRADE_DB": os.path.join(tmp, "t.db")}):
+            notifier = TelegramNotifier(token=None, chat_id=None)
+        now = monotonic()
+        notifier._tg_sent.extend([now] * RATE_LIMIT_MSGS)
+        sleep = Mock()
+
+        async def fake_sleep(delay):
+            sleep(delay)
+
+        with patch("bot.notifiers.telegram_notifier.asyncio.sleep", fake_sleep):
+            asyncio.run(notifier._throttle())
+        self.assertEqual(sleep.call_count, 1)
+        self.assertGreater(sleep.call_args[0][0], 59.0)
+
+
+if __name__ == '__main__':
+    unittest.main()